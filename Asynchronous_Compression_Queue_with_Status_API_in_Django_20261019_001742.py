@@ -0,0 +1,293 @@
+Title: Asynchronous Compression Queue with Status API in Django
+
+```python
+# settings.py
+# Local compression queue; jobs are stored in the database, no broker needed
+
+COMPRESSION_WORKERS = 2
+COMPRESSION_POLL_SECONDS = 2
+# A running job whose heartbeat is older than this is assumed dead and requeued
+COMPRESSION_STALE_SECONDS = 120
+
+# models.py in compression app
+from django.db import models
+
+class FileUpload(models.Model):
+    uploaded_file = models.FileField(upload_to='uploads/')
+
+class CompressionJob(models.Model):
+    """A queued compression of one FileUpload, persisted so it survives restarts."""
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [(QUEUED, 'Queued'), (RUNNING, 'Running'), (DONE, 'Done'), (FAILED, 'Failed')]
+
+    upload = models.OneToOneField(FileUpload, on_delete=models.CASCADE, related_name='compression_job')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    bytes_total = models.PositiveBigIntegerField(default=0)
+    bytes_done = models.PositiveBigIntegerField(default=0)
+    compressed_bytes = models.PositiveBigIntegerField(default=0)
+    zip_path = models.CharField(max_length=500, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+# jobs.py in compression app
+import logging
+import os
+import threading
+import time
+import zipfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import CompressionJob
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 1.0  # seconds between progress writes
+
+_wakeup = threading.Event()
+_started = False
+_start_lock = threading.Lock()
+_last_requeue = None
+_requeue_lock = threading.Lock()
+
+def claim_next_job():
+    """
+    Atomically move the oldest queued job to running and return it.
+
+    The claim is a conditional UPDATE from queued to running, which works
+    on every backend (SQLite ignores SELECT ... FOR UPDATE). A worker that
+    loses the race for a job simply tries the next oldest one.
+    """
+    while True:
+        job_id = (CompressionJob.objects
+                  .filter(status=CompressionJob.QUEUED)
+                  .order_by('created_at')
+                  .values_list('pk', flat=True)
+                  .first())
+        if job_id is None:
+            return None
+        now = timezone.now()
+        claimed = CompressionJob.objects.filter(pk=job_id, status=CompressionJob.QUEUED).update(
+            status=CompressionJob.RUNNING, started_at=now, heartbeat_at=now
+        )
+        if claimed:
+            return CompressionJob.objects.select_related('upload').get(pk=job_id)
+
+def requeue_stale_jobs():
+    """Return jobs orphaned by a crash or restart to the queue."""
+    cutoff = timezone.now() - timedelta(seconds=settings.COMPRESSION_STALE_SECONDS)
+    return CompressionJob.objects.filter(
+        status=CompressionJob.RUNNING, heartbeat_at__lt=cutoff
+    ).update(status=CompressionJob.QUEUED, bytes_done=0, compressed_bytes=0)
+
+def requeue_stale_jobs_periodically():
+    """Run requeue_stale_jobs at most once per stale interval across this process's workers."""
+    global _last_requeue
+    with _requeue_lock:
+        now = time.monotonic()
+        if _last_requeue is not None and now - _last_requeue < settings.COMPRESSION_STALE_SECONDS:
+            return
+        _last_requeue = now
+    requeued = requeue_stale_jobs()
+    if requeued:
+        logger.warning('Requeued %d stale compression jobs', requeued)
+
+def compress_job(job):
+    """Compress the upload in chunks, writing progress about once per second."""
+    file_path = job.upload.uploaded_file.path
+    zip_file_path = f'{os.path.splitext(file_path)[0]}.zip'
+    total = os.path.getsize(file_path)
+    CompressionJob.objects.filter(pk=job.pk).update(bytes_total=total)
+
+    done = 0
+    last_report = time.monotonic()
+    with open(file_path, 'rb') as source, \
+            zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipf.open(os.path.basename(file_path), 'w', force_zip64=True) as entry:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                entry.write(chunk)
+                done += len(chunk)
+                if time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                    last_report = time.monotonic()
+                    CompressionJob.objects.filter(pk=job.pk).update(
+                        bytes_done=done,
+                        compressed_bytes=zipf.fp.tell(),
+                        heartbeat_at=timezone.now(),
+                    )
+
+    CompressionJob.objects.filter(pk=job.pk).update(
+        status=CompressionJob.DONE,
+        bytes_done=done,
+        compressed_bytes=os.path.getsize(zip_file_path),
+        zip_path=zip_file_path,
+        finished_at=timezone.now(),
+    )
+
+def worker_loop():
+    """Run jobs one after another; sleep until woken or the poll interval passes."""
+    while True:
+        close_old_connections()
+        try:
+            # A worker that died in another process is noticed while this one keeps running
+            requeue_stale_jobs_periodically()
+            job = claim_next_job()
+        except Exception:
+            logger.exception('Could not claim a compression job')
+            job = None
+        if job is None:
+            _wakeup.wait(settings.COMPRESSION_POLL_SECONDS)
+            _wakeup.clear()
+            continue
+        try:
+            compress_job(job)
+        except Exception as e:
+            logger.exception('Compression job %s failed', job.pk)
+            CompressionJob.objects.filter(pk=job.pk).update(
+                status=CompressionJob.FAILED, error=str(e), finished_at=timezone.now()
+            )
+
+def start_workers(sender=None, **kwargs):
+    """
+    Start the fixed-size worker pool once per process.
+
+    Connected to request_started, so workers only run in processes that
+    serve requests, never in management commands or test runners, and the
+    first database access happens outside AppConfig.ready().
+    """
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+    for number in range(settings.COMPRESSION_WORKERS):
+        threading.Thread(target=worker_loop, name=f'compression-{number}', daemon=True).start()
+
+def notify_workers():
+    _wakeup.set()
+
+# apps.py in compression app
+from django.apps import AppConfig
+
+class CompressionConfig(AppConfig):
+    name = 'compression'
+
+    def ready(self):
+        # Workers start with the first request a process serves; ready() must
+        # not touch the database, and commands like migrate never get a request
+        from django.core.signals import request_started
+        from .jobs import start_workers
+        request_started.connect(start_workers, dispatch_uid='compression_start_workers')
+
+# views.py in compression app
+from django.db import transaction
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
+from .forms import FileUploadForm
+from .models import CompressionJob
+from .jobs import notify_workers
+
+def upload_and_compress(request):
+    if request.method == 'POST':
+        form = FileUploadForm(request.POST, request.FILES)
+        if form.is_valid():
+            with transaction.atomic():
+                file_instance = form.save()
+                job = CompressionJob.objects.create(upload=file_instance)
+                transaction.on_commit(notify_workers)
+            return redirect('upload_success', job_id=job.pk)
+    else:
+        form = FileUploadForm()
+    return render(request, 'upload.html', {'form': form})
+
+def upload_success(request, job_id):
+    return render(request, 'success.html', {'job_id': job_id})
+
+def compression_status(request, job_id):
+    """Report progress, ratio so far and an ETA based on the throughput so far."""
+    job = get_object_or_404(CompressionJob, pk=job_id)
+    payload = {
+        'job_id': job.pk,
+        'status': job.status,
+        'bytes_total': job.bytes_total,
+        'bytes_processed': job.bytes_done,
+        'ratio': round(job.compressed_bytes / job.bytes_done, 4) if job.bytes_done else None,
+        'eta_seconds': None,
+    }
+    if job.status == CompressionJob.RUNNING and job.started_at and job.bytes_done:
+        elapsed = (timezone.now() - job.started_at).total_seconds()
+        rate = job.bytes_done / elapsed if elapsed > 0 else 0
+        if rate:
+            payload['eta_seconds'] = round((job.bytes_total - job.bytes_done) / rate, 1)
+    if job.status == CompressionJob.QUEUED:
+        payload['queue_position'] = CompressionJob.objects.filter(
+            status=CompressionJob.QUEUED, created_at__lt=job.created_at
+        ).count() + 1
+    if job.status == CompressionJob.FAILED:
+        payload['error'] = job.error
+    return JsonResponse(payload)
+
+# urls.py in compression app
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.upload_and_compress, name='upload_and_compress'),
+    path('success/<int:job_id>/', views.upload_success, name='upload_success'),
+    path('jobs/<int:job_id>/', views.compression_status, name='compression_status'),
+]
+
+# templates/success.html
+'''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Upload Received</title>
+    <style>
+        body { font-family: Arial, sans-serif; text-align: center; margin-top: 40px; }
+        progress { width: 90%; max-width: 400px; }
+    </style>
+</head>
+<body>
+    <h1>File Uploaded</h1>
+    <p id="status">Waiting for compression to start...</p>
+    <progress id="bar" value="0" max="1"></progress>
+    <script>
+        async function poll() {
+            const job = await (await fetch("{% url 'compression_status' job_id %}")).json();
+            const bar = document.getElementById('bar');
+            bar.max = job.bytes_total || 1;
+            bar.value = job.bytes_processed;
+            let text = job.status;
+            if (job.eta_seconds !== null) text += `, about ${Math.ceil(job.eta_seconds)} s left`;
+            if (job.ratio !== null) text += `, ratio ${job.ratio}`;
+            document.getElementById('status').textContent = text;
+            if (job.status === 'queued' || job.status === 'running') setTimeout(poll, 1000);
+        }
+        poll();
+    </script>
+    <a href="{% url 'upload_and_compress' %}">Upload Another File</a>
+</body>
+</html>
+'''
+```
+
+In this version of the compression app, `upload_and_compress` no longer compresses inside the request. It saves the upload together with a `CompressionJob` row and redirects right away. The queue lives in the database, so it needs no broker and survives restarts. Each process starts a fixed number of worker threads when it serves its first request. The workers claim queued jobs with a conditional `UPDATE` from `queued` to `running`, so each job runs exactly once even with several server processes, on SQLite as well as other databases. A new upload wakes the workers immediately, and otherwise they poll. While compressing, a worker records bytes processed, compressed bytes and a heartbeat about once a second. The workers also check periodically for running jobs whose heartbeat has gone stale, for example after a crash, and put them back in the queue. The status endpoint reports progress, the compression ratio so far, an ETA based on the throughput so far and the position in the queue. The success page polls it to show a progress bar.
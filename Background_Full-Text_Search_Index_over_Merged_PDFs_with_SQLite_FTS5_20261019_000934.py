@@ -0,0 +1,206 @@
+Title: Background Full-Text Search Index over Merged PDFs with SQLite FTS5
+
+```python
+# Install the required packages:
+# pip install django PyPDF2
+# Builds on the pdf_jobs app (MergeJob and the background merge worker).
+# Python's bundled sqlite3 must be compiled with FTS5, which is the default
+# on current CPython builds.
+
+# settings.py
+PDF_SEARCH_INDEX_PATH = os.path.join(BASE_DIR, 'pdf_search.sqlite3')
+
+# pdf_jobs/search_index.py
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from django.conf import settings
+from PyPDF2 import PdfReader
+
+logger = logging.getLogger(__name__)
+
+# UNINDEXED FTS5 columns can only be filtered by scanning the whole table,
+# so page_rows maps each job to the rowids of its pages for re-indexing
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(
+    job_id UNINDEXED,
+    page UNINDEXED,
+    body,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS page_rows (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS page_rows_job_id ON page_rows (job_id);
+"""
+
+# SQLite allows one writer at a time, so a single thread does all indexing
+_index_executor: Optional[ThreadPoolExecutor] = None
+_index_executor_lock = threading.Lock()
+_local = threading.local()
+
+def get_connection() -> sqlite3.Connection:
+    """Return this thread's connection to the search index."""
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = sqlite3.connect(settings.PDF_SEARCH_INDEX_PATH)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.executescript(SCHEMA)
+        _local.connection = connection
+    return connection
+
+def index_pdf(job_id: str, pdf_path: str) -> int:
+    """
+    Extract the text of every page and store it keyed by job and page.
+
+    Existing rows for the job are replaced in the same transaction, so
+    indexing a job twice never leaves duplicates. They are found through
+    page_rows and deleted by rowid. Returns the page count.
+    """
+    pdf_reader = PdfReader(pdf_path)
+    rows = []
+    for number, page in enumerate(pdf_reader.pages, start=1):
+        text = page.extract_text() or ''
+        if text.strip():
+            rows.append((job_id, number, text))
+
+    connection = get_connection()
+    with connection:
+        connection.execute(
+            'DELETE FROM page_text WHERE rowid IN (SELECT id FROM page_rows WHERE job_id = ?)', (job_id,)
+        )
+        connection.execute('DELETE FROM page_rows WHERE job_id = ?', (job_id,))
+        for row in rows:
+            rowid = connection.execute('INSERT INTO page_rows (job_id) VALUES (?)', (job_id,)).lastrowid
+            connection.execute(
+                'INSERT INTO page_text (rowid, job_id, page, body) VALUES (?, ?, ?, ?)', (rowid, *row)
+            )
+    return len(pdf_reader.pages)
+
+def _index_job(job_id: str, pdf_path: str) -> None:
+    try:
+        pages = index_pdf(job_id, pdf_path)
+        logger.info('Indexed %d pages of merge job %s', pages, job_id)
+    except Exception:
+        logger.exception('Indexing merge job %s failed', job_id)
+
+def index_merge_job_async(job_id, pdf_path: str) -> None:
+    """Queue text extraction for a finished merge without blocking the caller."""
+    global _index_executor
+    # Merges finish on several pool threads; two indexers would defeat the single writer
+    with _index_executor_lock:
+        if _index_executor is None:
+            _index_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-index')
+    _index_executor.submit(_index_job, str(job_id), pdf_path)
+
+def search(query: str, limit: int = 50) -> List[dict]:
+    """
+    Find pages matching an FTS5 query, best matches first.
+
+    Plain terms are quoted so that account numbers with dashes or dots are
+    matched as phrases instead of being read as query syntax.
+    """
+    terms = ' '.join('"{}"'.format(term.replace('"', '""')) for term in query.split())
+    if not terms:
+        return []
+    rows = get_connection().execute(
+        """
+        SELECT job_id, page, snippet(page_text, 2, '[', ']', '…', 12)
+        FROM page_text
+        WHERE page_text MATCH ?
+        ORDER BY rank
+        LIMIT ?
+        """,
+        (terms, limit),
+    ).fetchall()
+    return [{'job_id': job_id, 'page': page, 'snippet': snippet} for job_id, page, snippet in rows]
+
+# pdf_jobs/worker.py (changes)
+# _merge() hands the finished result to the indexer once the job is marked done
+from .search_index import index_merge_job_async
+
+def _merge(job_id) -> None:
+    job = MergeJob.objects.get(pk=job_id)
+    readers = [PdfReader(item.pdf_file.path) for item in job.inputs.all()]
+    total = sum(len(reader.pages) for reader in readers)
+    MergeJob.objects.filter(pk=job.pk).update(total_pages=total, heartbeat_at=timezone.now())
+
+    pdf_writer = PdfWriter()
+    done = 0
+    for reader in readers:
+        for page in reader.pages:
+            pdf_writer.add_page(page)
+            done += 1
+            if done % PROGRESS_EVERY == 0:
+                # Progress writes double as the heartbeat that marks the job alive
+                MergeJob.objects.filter(pk=job.pk).update(pages_done=done, heartbeat_at=timezone.now())
+
+    result_name = f'merge_jobs/results/{job.pk}.pdf'
+    result_path = os.path.join(settings.MEDIA_ROOT, result_name)
+    os.makedirs(os.path.dirname(result_path), exist_ok=True)
+    with open(result_path, 'wb') as output_pdf:
+        pdf_writer.write(output_pdf)
+
+    MergeJob.objects.filter(pk=job.pk).update(
+        status=MergeJob.STATUS_DONE,
+        pages_done=done,
+        result_file=result_name,
+        finished_at=timezone.now(),
+    )
+    # Indexing runs on its own thread, so a slow extraction never delays the job
+    index_merge_job_async(job.pk, result_path)
+
+# pdf_jobs/views.py (addition)
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+from .search_index import search
+
+@require_GET
+def search_merged_pdfs(request):
+    """Return the merge jobs and pages whose text matches `q`."""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({"error": "Missing search query"}, status=400)
+    try:
+        limit = max(1, min(int(request.GET.get('limit', 50)), 500))
+    except ValueError:
+        return JsonResponse({"error": "limit must be a number"}, status=400)
+
+    results = search(query, limit)
+    for result in results:
+        result['download_url'] = reverse('merge_job_download', args=[result['job_id']])
+    return JsonResponse({"query": query, "results": results})
+
+# pdf_jobs/management/commands/reindex_merged_pdfs.py
+from django.core.management.base import BaseCommand
+from ...models import MergeJob
+from ...search_index import index_pdf
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text index for every finished merge job'
+
+    def handle(self, *args, **options):
+        jobs = MergeJob.objects.filter(status=MergeJob.STATUS_DONE).exclude(result_file='')
+        for job in jobs.iterator():
+            pages = index_pdf(str(job.pk), job.result_file.path)
+            self.stdout.write(f'{job.pk}: {pages} pages')
+
+# pdf_jobs/urls.py (addition)
+from django.urls import path
+from . import views
+
+urlpatterns += [
+    path('merge-jobs/search/', views.search_merged_pdfs, name='search_merged_pdfs'),
+]
+
+# Example:
+# curl "http://localhost:8000/merge-jobs/search/?q=DE89-3704-0044"
+#   -> {"results": [{"job_id": "...", "page": 12, "snippet": "Account [DE89-3704-0044] ..."}]}
+```
+
+This addition to the background merge jobs app makes merged documents searchable. When a merge finishes, the worker queues the result on a single-thread indexer. The indexer extracts the text of each page with PyPDF2 and writes it to an SQLite FTS5 virtual table keyed by merge job ID and page number. A small regular table maps each job to the row IDs of its pages, so re-indexing a job deletes its old rows by row ID instead of scanning the whole index. The index lives in its own SQLite file in WAL mode, so searches do not wait for indexing and the main database is untouched. The search endpoint quotes each term so that account numbers are matched as phrases, and it returns the job, page and a highlighted snippet for each hit. `reindex_merged_pdfs` rebuilds the index from the stored results.
@@ -0,0 +1,298 @@
+Title: Background PDF Merge Jobs with Progress Polling in Django
+
+```python
+# Install the required packages:
+# pip install django PyPDF2
+
+# settings.py
+# Add the app and configure the local worker pool used for merge jobs
+
+INSTALLED_APPS = [
+    # ...
+    'pdf_jobs',
+]
+
+# Number of merges that may run at the same time in each Django process
+PDF_MERGE_WORKERS = 2
+# A running job whose heartbeat is older than this is assumed dead and requeued
+PDF_MERGE_STALE_SECONDS = 300
+
+# pdf_jobs/models.py
+import uuid
+from django.db import models
+
+class MergeJob(models.Model):
+    """A PDF merge queued for background processing."""
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+    total_pages = models.PositiveIntegerField(default=0)
+    pages_done = models.PositiveIntegerField(default=0)
+    result_file = models.FileField(upload_to='merge_jobs/results/', blank=True, null=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def progress(self) -> float:
+        """Return the fraction of pages merged so far."""
+        if not self.total_pages:
+            return 0.0
+        return self.pages_done / self.total_pages
+
+class MergeJobInput(models.Model):
+    """One uploaded PDF belonging to a merge job, kept in upload order."""
+    job = models.ForeignKey(MergeJob, related_name='inputs', on_delete=models.CASCADE)
+    position = models.PositiveIntegerField()
+    pdf_file = models.FileField(upload_to='merge_jobs/inputs/')
+
+    class Meta:
+        ordering = ['position']
+
+# pdf_jobs/worker.py
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+from PyPDF2 import PdfReader, PdfWriter
+
+from .models import MergeJob
+
+logger = logging.getLogger(__name__)
+
+# Only write progress to the database every N pages to keep the merge loop cheap
+PROGRESS_EVERY = 10
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_recovered = False
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = getattr(settings, 'PDF_MERGE_WORKERS', 2)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdf-merge')
+        return _executor
+
+def enqueue(job_id) -> None:
+    """Queue a merge job on the local worker pool."""
+    get_executor().submit(run_merge_job, job_id)
+
+def claim_job(job_id) -> bool:
+    """
+    Atomically move a queued job to running.
+
+    Every process may hold the same job ID in its pool, e.g. after a restart;
+    only the one whose conditional update matches the queued row runs it.
+    """
+    now = timezone.now()
+    claimed = MergeJob.objects.filter(pk=job_id, status=MergeJob.STATUS_QUEUED).update(
+        status=MergeJob.STATUS_RUNNING, started_at=now, heartbeat_at=now, pages_done=0
+    )
+    return claimed == 1
+
+def run_merge_job(job_id) -> None:
+    """
+    Merge the inputs of a job page by page, recording progress as it goes.
+
+    Runs on a pool thread, so it opens its own database connection and
+    closes it again when the job is finished.
+    """
+    close_old_connections()
+    try:
+        if not claim_job(job_id):
+            return
+        try:
+            _merge(job_id)
+        except Exception as e:
+            logger.exception('Merge job %s failed', job_id)
+            MergeJob.objects.filter(pk=job_id).update(
+                status=MergeJob.STATUS_FAILED, error=str(e), finished_at=timezone.now()
+            )
+    finally:
+        close_old_connections()
+
+def _merge(job_id) -> None:
+    job = MergeJob.objects.get(pk=job_id)
+    readers = [PdfReader(item.pdf_file.path) for item in job.inputs.all()]
+    total = sum(len(reader.pages) for reader in readers)
+    MergeJob.objects.filter(pk=job.pk).update(total_pages=total, heartbeat_at=timezone.now())
+
+    pdf_writer = PdfWriter()
+    done = 0
+    for reader in readers:
+        for page in reader.pages:
+            pdf_writer.add_page(page)
+            done += 1
+            if done % PROGRESS_EVERY == 0:
+                # Progress writes double as the heartbeat that marks the job alive
+                MergeJob.objects.filter(pk=job.pk).update(pages_done=done, heartbeat_at=timezone.now())
+
+    result_name = f'merge_jobs/results/{job.pk}.pdf'
+    result_path = os.path.join(settings.MEDIA_ROOT, result_name)
+    os.makedirs(os.path.dirname(result_path), exist_ok=True)
+    with open(result_path, 'wb') as output_pdf:
+        pdf_writer.write(output_pdf)
+
+    MergeJob.objects.filter(pk=job.pk).update(
+        status=MergeJob.STATUS_DONE,
+        pages_done=done,
+        result_file=result_name,
+        finished_at=timezone.now(),
+    )
+
+def recover_jobs() -> None:
+    """
+    Requeue running jobs whose heartbeat went stale and queue every queued job.
+
+    Live jobs keep a fresh heartbeat and are left alone. Queued jobs may end
+    up in several processes' pools; claim_job lets exactly one of them run.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.PDF_MERGE_STALE_SECONDS)
+    MergeJob.objects.filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True),
+        status=MergeJob.STATUS_RUNNING,
+    ).update(status=MergeJob.STATUS_QUEUED, pages_done=0)
+    for job_id in MergeJob.objects.filter(status=MergeJob.STATUS_QUEUED).values_list('pk', flat=True):
+        enqueue(job_id)
+
+def _recover_in_background() -> None:
+    close_old_connections()
+    try:
+        recover_jobs()
+    except Exception:
+        logger.exception('Could not recover merge jobs')
+    finally:
+        close_old_connections()
+
+def recover_jobs_once(sender=None, **kwargs) -> None:
+    """request_started receiver: recover jobs on the first request a process serves."""
+    global _recovered
+    with _executor_lock:
+        if _recovered:
+            return
+        _recovered = True
+    get_executor().submit(_recover_in_background)
+
+# pdf_jobs/views.py
+from django.db import transaction
+from django.http import FileResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from .models import MergeJob, MergeJobInput
+from .worker import enqueue
+
+@csrf_exempt
+@require_POST
+def create_merge_job(request):
+    """Store the uploaded PDFs, queue the merge and return the job ID at once."""
+    files = request.FILES.getlist('pdf_files')
+    if not files:
+        return JsonResponse({"error": "No PDF files uploaded"}, status=400)
+    for pdf in files:
+        if not pdf.name.lower().endswith('.pdf'):
+            return JsonResponse({"error": "All files must be PDFs"}, status=400)
+
+    with transaction.atomic():
+        job = MergeJob.objects.create()
+        for position, pdf in enumerate(files):
+            MergeJobInput.objects.create(job=job, position=position, pdf_file=pdf)
+        # Only hand the job to a worker once the inputs are committed
+        transaction.on_commit(lambda: enqueue(job.pk))
+
+    return JsonResponse(
+        {
+            "job_id": str(job.pk),
+            "status_url": reverse('merge_job_status', args=[job.pk]),
+        },
+        status=202,
+    )
+
+@require_GET
+def merge_job_status(request, job_id):
+    """Report the state and page-level progress of a merge job."""
+    job = get_object_or_404(MergeJob, pk=job_id)
+    payload = {
+        "job_id": str(job.pk),
+        "status": job.status,
+        "pages_done": job.pages_done,
+        "total_pages": job.total_pages,
+        "progress": round(job.progress(), 4),
+    }
+    if job.status == MergeJob.STATUS_DONE:
+        payload["download_url"] = reverse('merge_job_download', args=[job.pk])
+    if job.status == MergeJob.STATUS_FAILED:
+        payload["error"] = job.error
+    return JsonResponse(payload)
+
+@require_GET
+def merge_job_download(request, job_id):
+    """Return the merged PDF once the job has finished."""
+    job = get_object_or_404(MergeJob, pk=job_id)
+    if job.status != MergeJob.STATUS_DONE:
+        return JsonResponse({"error": "Merge job is not finished", "status": job.status}, status=409)
+    return FileResponse(
+        job.result_file.open('rb'),
+        as_attachment=True,
+        filename='merged_document.pdf',
+        content_type='application/pdf',
+    )
+
+# pdf_jobs/apps.py
+from django.apps import AppConfig
+
+class PdfJobsConfig(AppConfig):
+    name = 'pdf_jobs'
+
+    def ready(self):
+        # Recovering jobs needs the database, which ready() must not touch,
+        # so it runs on each process's first request instead. Set
+        # PDF_MERGE_REQUEUE_ON_START = False to leave recovery to an operator.
+        from django.conf import settings
+        if getattr(settings, 'PDF_MERGE_REQUEUE_ON_START', True):
+            from django.core.signals import request_started
+            from .worker import recover_jobs_once
+            request_started.connect(recover_jobs_once, dispatch_uid='pdf_jobs_recover')
+
+# pdf_jobs/urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('merge-jobs/', views.create_merge_job, name='create_merge_job'),
+    path('merge-jobs/<uuid:job_id>/', views.merge_job_status, name='merge_job_status'),
+    path('merge-jobs/<uuid:job_id>/download/', views.merge_job_download, name='merge_job_download'),
+]
+
+# Example client usage:
+# curl -F "pdf_files=@a.pdf" -F "pdf_files=@b.pdf" http://localhost:8000/merge-jobs/
+#   -> {"job_id": "...", "status_url": "/merge-jobs/<id>/"}
+# curl http://localhost:8000/merge-jobs/<id>/
+#   -> {"status": "running", "pages_done": 120, "total_pages": 480, "progress": 0.25}
+# curl -OJ http://localhost:8000/merge-jobs/<id>/download/
+```
+
+This Django app moves PDF merging out of the request cycle. The upload view stores the files, creates a `MergeJob` and returns its ID with a `202 Accepted` status straight away. The merge itself runs on a `ThreadPoolExecutor` inside the Django process, so no external broker such as Redis or RabbitMQ is needed. The worker records how many pages have been merged, which clients can poll through the status endpoint before they download the finished document. Workers claim a job with a conditional update from `queued` to `running`, so a job runs once even when several processes hold its ID. Progress writes also act as a heartbeat. On each process's first request, running jobs with a stale heartbeat go back to the queue, and queued jobs are picked up again. Jobs that a live worker is still merging are left alone.
@@ -0,0 +1,323 @@
+Title: Benchmark Suite for PDF Merge Implementations in Django
+
+```python
+# Install necessary package
+# pip install PyPDF2
+
+# benchmarks/pdf_corpus.py
+# Generate a synthetic PDF corpus without any dependency besides the standard library
+
+import os
+import random
+import zlib
+from typing import List
+
+def _pdf_bytes(pages: int, image_size: int, seed: int) -> bytes:
+    """
+    Build a small but valid PDF with `pages` text pages.
+
+    When `image_size` is non-zero every page also draws an RGB image of
+    `image_size` x `image_size` pixels filled with noise, which compresses
+    about as badly as a scanned photo does.
+    """
+    rng = random.Random(seed)
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    font_id = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    image_id = None
+    if image_size:
+        pixels = bytes(rng.getrandbits(8) for _ in range(image_size * image_size * 3))
+        data = zlib.compress(pixels)
+        image_id = add(
+            b'<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB '
+            b'/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream'
+            % (image_size, image_size, len(data), data)
+        )
+
+    pages_id = len(objects) + 1
+    add(b'')  # placeholder for the page tree, filled in below
+    page_ids = []
+    for number in range(1, pages + 1):
+        text = f'Synthetic page {number} of {pages} (seed {seed})'.encode('latin-1')
+        content = b'BT /F1 18 Tf 72 720 Td (%s) Tj ET' % text
+        if image_id:
+            content += b'\nq 300 0 0 300 72 300 cm /Im1 Do Q'
+        content_id = add(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content))
+        xobjects = b' /XObject << /Im1 %d 0 R >>' % image_id if image_id else b''
+        page_ids.append(add(
+            b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 %d 0 R >>%s >> /Contents %d 0 R >>'
+            % (pages_id, font_id, xobjects, content_id)
+        ))
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    objects[pages_id - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, pages)
+    catalog_id = add(b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id)
+
+    out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref_offset = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        out += b'%010d 00000 n \n' % offset
+    out += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, catalog_id, xref_offset
+    )
+    return bytes(out)
+
+def generate_corpus(root: str, page_counts=(1, 20, 200), file_counts=(2, 10, 50),
+                    image_sizes=(0, 256)) -> List[dict]:
+    """
+    Write one case directory per combination of pages, files and images.
+
+    Generation is seeded, so the same parameters always give the same bytes
+    and results from different runs stay comparable.
+    """
+    cases = []
+    for pages in page_counts:
+        for files in file_counts:
+            for image_size in image_sizes:
+                name = f'p{pages}_f{files}_img{image_size}'
+                case_dir = os.path.join(root, name)
+                os.makedirs(case_dir, exist_ok=True)
+                paths = []
+                for index in range(files):
+                    path = os.path.join(case_dir, f'{index:03d}.pdf')
+                    if not os.path.exists(path):
+                        with open(path, 'wb') as pdf_file:
+                            pdf_file.write(_pdf_bytes(pages, image_size, seed=index))
+                    paths.append(path)
+                cases.append({'name': name, 'pages': pages, 'files': files,
+                              'image_size': image_size, 'paths': paths})
+    return cases
+
+# benchmarks/merge_strategies.py
+# One function per merge variant found in the repository. Each receives a list
+# of file-like uploads and returns the merged bytes the client would receive.
+
+import io
+import os
+import shutil
+import tempfile
+from PyPDF2 import PdfMerger, PdfReader, PdfWriter
+
+def writer_loop_stream(uploads) -> bytes:
+    """PdfWriter.add_page loop straight from the uploads (merge_pdfs, PDFMergeView.post)."""
+    pdf_writer = PdfWriter()
+    for upload in uploads:
+        pdf_reader = PdfReader(upload)
+        for page in range(len(pdf_reader.pages)):
+            pdf_writer.add_page(pdf_reader.pages[page])
+    response = io.BytesIO()
+    pdf_writer.write(response)
+    return response.getvalue()
+
+def writer_loop_tmp_files(uploads) -> bytes:
+    """Copy uploads to temporary files, then PdfWriter.add_page by path (handle_pdf_upload)."""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_names = []
+        for index, upload in enumerate(uploads):
+            file_name = os.path.join(tmp_dir, f'{index}.pdf')
+            with open(file_name, 'wb+') as destination:
+                shutil.copyfileobj(upload, destination)
+            file_names.append(file_name)
+
+        pdf_writer = PdfWriter()
+        for file_path in file_names:
+            pdf_reader = PdfReader(file_path)
+            for page in range(len(pdf_reader.pages)):
+                pdf_writer.add_page(pdf_reader.pages[page])
+        response = io.BytesIO()
+        pdf_writer.write(response)
+        return response.getvalue()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def writer_loop_disk_output(uploads) -> bytes:
+    """PdfWriter.add_page loop written to a file and read back (pdf_utils.merge_pdfs)."""
+    pdf_writer = PdfWriter()
+    for upload in uploads:
+        pdf_reader = PdfReader(upload)
+        for page_num in range(len(pdf_reader.pages)):
+            pdf_writer.add_page(pdf_reader.pages[page_num])
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_path = os.path.join(output_dir, 'merged_document.pdf')
+        with open(output_path, 'wb') as output_pdf:
+            pdf_writer.write(output_pdf)
+        with open(output_path, 'rb') as pdf_file:
+            return pdf_file.read()
+
+def merger_bytesio_copy(uploads) -> bytes:
+    """PdfMerger.append on a BytesIO copy of each upload (PDFMergerView.merge_pdfs)."""
+    pdf_merger = PdfMerger()
+    for pdf_file in uploads:
+        pdf_merger.append(io.BytesIO(pdf_file.read()))
+    merged_pdf_stream = io.BytesIO()
+    pdf_merger.write(merged_pdf_stream)
+    pdf_merger.close()
+    return merged_pdf_stream.getvalue()
+
+def merger_direct(uploads) -> bytes:
+    """PdfMerger.append on the uploads themselves (upload_and_merge_pdf)."""
+    merger = PdfMerger()
+    try:
+        for pdf in uploads:
+            merger.append(pdf)
+        response = io.BytesIO()
+        merger.write(response)
+        return response.getvalue()
+    finally:
+        merger.close()
+
+STRATEGIES = {
+    'writer_loop_stream': writer_loop_stream,
+    'writer_loop_tmp_files': writer_loop_tmp_files,
+    'writer_loop_disk_output': writer_loop_disk_output,
+    'merger_bytesio_copy': merger_bytesio_copy,
+    'merger_direct': merger_direct,
+}
+
+# benchmarks/bench_pdf_merge.py
+# Usage:
+#   python benchmarks/bench_pdf_merge.py --corpus /tmp/pdf_corpus
+#   python benchmarks/bench_pdf_merge.py --quick --strategy merger_direct
+
+import argparse
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from pdf_corpus import generate_corpus
+from merge_strategies import STRATEGIES
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results', 'pdf_merge.jsonl')
+REGRESSION_THRESHOLD = 1.10  # flag anything 10% slower or heavier than the last run
+
+def load_uploads(paths):
+    """Hold the inputs in memory, as Django does for small uploads, so disk reads are not timed."""
+    uploads = []
+    for path in paths:
+        with open(path, 'rb') as pdf_file:
+            uploads.append(io.BytesIO(pdf_file.read()))
+    return uploads
+
+def run_case(strategy, paths, repeat):
+    """
+    Return the best wall time, the peak traced memory and the output size.
+
+    tracemalloc hooks every allocation and slows the code it watches, so
+    the timed runs happen with it off and memory is measured in one
+    extra, untimed run.
+    """
+    best_seconds = None
+    output_size = 0
+    for _ in range(repeat):
+        uploads = load_uploads(paths)
+        gc.collect()
+        started = time.perf_counter()
+        output = strategy(uploads)
+        seconds = time.perf_counter() - started
+        best_seconds = seconds if best_seconds is None else min(best_seconds, seconds)
+        output_size = len(output)
+
+    uploads = load_uploads(paths)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        strategy(uploads)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': round(best_seconds, 4), 'peak_bytes': peak_bytes, 'output_bytes': output_size}
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def previous_results():
+    """Return the rows of the most recent stored run keyed by (strategy, case)."""
+    if not os.path.exists(RESULTS_FILE):
+        return {}
+    last_run = None
+    rows = {}
+    with open(RESULTS_FILE) as results:
+        for line in results:
+            row = json.loads(line)
+            if row['run_id'] != last_run:
+                last_run, rows = row['run_id'], {}
+            rows[(row['strategy'], row['case'])] = row
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the PDF merge implementations.')
+    parser.add_argument('--corpus', default=os.path.join(tempfile.gettempdir(), 'pdf_corpus'))
+    parser.add_argument('--strategy', action='append', choices=sorted(STRATEGIES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--quick', action='store_true', help='Use a small corpus for a fast check')
+    parser.add_argument('--no-save', action='store_true', help='Do not append results to the history file')
+    args = parser.parse_args()
+
+    if args.quick:
+        cases = generate_corpus(args.corpus, page_counts=(1, 20), file_counts=(2, 10), image_sizes=(0, 64))
+    else:
+        cases = generate_corpus(args.corpus)
+
+    run_id = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    revision = git_revision()
+    baseline = previous_results()
+    rows = []
+    for name in args.strategy or sorted(STRATEGIES):
+        for case in cases:
+            result = run_case(STRATEGIES[name], case['paths'], args.repeat)
+            row = {
+                'run_id': run_id,
+                'revision': revision,
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'strategy': name,
+                'case': case['name'],
+                'pages': case['pages'],
+                'files': case['files'],
+                'image_size': case['image_size'],
+                **result,
+            }
+            rows.append(row)
+
+            flags = []
+            previous = baseline.get((name, case['name']))
+            if previous:
+                for metric in ('seconds', 'peak_bytes', 'output_bytes'):
+                    if previous[metric] and row[metric] > previous[metric] * REGRESSION_THRESHOLD:
+                        flags.append(f'{metric} +{row[metric] / previous[metric] - 1:.0%}')
+            print(f"{name:<24} {case['name']:<18} {row['seconds']:>9.4f}s "
+                  f"{row['peak_bytes'] / 1e6:>9.1f} MB peak {row['output_bytes'] / 1e6:>9.2f} MB out"
+                  + (f"  REGRESSION: {', '.join(flags)}" if flags else ''))
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+        with open(RESULTS_FILE, 'a') as results:
+            for row in rows:
+                results.write(json.dumps(row) + '\n')
+
+if __name__ == '__main__':
+    main()
+```
+
+This benchmark suite puts numbers on the five PDF merge variants in the repository. `pdf_corpus.py` writes a seeded synthetic corpus using only the standard library. It varies the page count, the number of files and whether each page embeds a noisy RGB image that compresses poorly, like a scan. `merge_strategies.py` repeats each variant's approach: `PdfWriter.add_page` loops against `PdfMerger.append`, and in-memory `BytesIO` handling against temporary files on disk. `bench_pdf_merge.py` runs every strategy on every case and records the best wall time, the peak memory traced by `tracemalloc` and the output size. The timed runs happen with tracing off, and memory is measured in a separate run so tracing overhead never skews the timings. Each run is appended to `benchmarks/results/pdf_merge.jsonl` along with the git revision, and any metric more than 10% worse than the previous run is flagged as a regression.
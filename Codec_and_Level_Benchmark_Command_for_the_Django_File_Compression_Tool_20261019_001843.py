@@ -0,0 +1,240 @@
+Title: Codec and Level Benchmark Command for the Django File Compression Tool
+
+```python
+# Builds on codecs.py (the codec registry used by compress_file).
+# Optional: pip install zstandard
+
+# codecs.py in myapp (addition)
+# Readers for every codec, used to measure decompression speed
+# (zstandard is the optional import already at the top of codecs.py)
+
+import bz2
+import gzip
+import lzma
+import zipfile
+
+class _ZipEntryReader:
+    """Read the single entry of an archive written by _ZipEntryWriter."""
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path)
+        self.entry = self.archive.open(self.archive.infolist()[0])
+
+    def read(self, size=-1):
+        return self.entry.read(size)
+
+    def close(self):
+        self.entry.close()
+        self.archive.close()
+
+def _open_zstd_reader(path):
+    return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+
+READERS = {
+    'store': lambda path: open(path, 'rb'),
+    'deflate': _ZipEntryReader,
+    'gzip': lambda path: gzip.open(path, 'rb'),
+    'bz2': lambda path: bz2.open(path, 'rb'),
+    'lzma': lambda path: lzma.open(path, 'rb'),
+}
+if zstandard is not None:
+    READERS['zstd'] = _open_zstd_reader
+
+# management/commands/benchmark_codecs.py in myapp
+import csv
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...codecs import CODECS, READERS
+
+CHUNK_SIZE = 64 * 1024  # the chunk size Django's File.chunks() uses
+
+def _generate_corpus(root, size):
+    """Write one synthetic sample per content type when no corpus is given."""
+    rng = random.Random(42)
+    words = ['invoice', 'customer', 'order', 'shipped', 'total', 'error', 'warning',
+             'request', 'response', 'user', 'session', 'payment', 'status', 'id']
+    samples = {}
+
+    text = ' '.join(rng.choice(words) for _ in range(size // 6)).encode()[:size]
+    samples['text'] = text
+
+    lines = []
+    while sum(len(line) for line in lines) < size:
+        lines.append(
+            f'2026-10-19T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}Z '
+            f'{rng.choice(["INFO", "WARN", "ERROR"])} worker-{rng.randrange(8)} '
+            f'{rng.choice(words)} id={rng.randrange(10 ** 6)} took {rng.randrange(900)}ms\n'.encode()
+        )
+    samples['logs'] = b''.join(lines)[:size]
+
+    # Stand-in for JPEG/MP4: already-compressed data looks random
+    samples['images'] = rng.randbytes(size)
+
+    # Executable-like data: runs of structure mixed with noise
+    blocks = []
+    while sum(len(block) for block in blocks) < size:
+        blocks.append(bytes(rng.randrange(16)) * rng.randrange(1, 64))
+        blocks.append(rng.randbytes(rng.randrange(16, 256)))
+    samples['binaries'] = b''.join(blocks)[:size]
+
+    corpus = {}
+    for content_type, data in samples.items():
+        directory = os.path.join(root, content_type)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, 'sample.bin')
+        with open(path, 'wb') as f:
+            f.write(data)
+        corpus[content_type] = [path]
+    return corpus
+
+def _load_corpus(root):
+    """Each subdirectory of the corpus is one content type."""
+    corpus = {}
+    for content_type in sorted(os.listdir(root)):
+        directory = os.path.join(root, content_type)
+        if os.path.isdir(directory):
+            files = [os.path.join(directory, name) for name in sorted(os.listdir(directory))]
+            files = [path for path in files if os.path.isfile(path)]
+            if files:
+                corpus[content_type] = files
+    return corpus
+
+def _peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def run_combination(codec, level, paths, scratch_dir):
+    """
+    Compress and decompress every file the way compress_file does.
+
+    Runs in a fresh process so the resident-set high-water mark belongs to
+    this combination alone.
+    """
+    spec = CODECS[codec]
+    baseline_rss = _peak_rss_bytes()
+    original = compressed = 0
+    compress_seconds = decompress_seconds = 0.0
+
+    for index, path in enumerate(paths):
+        target = os.path.join(scratch_dir, f'{codec}-{level}-{index}{spec.extension}')
+        started = time.perf_counter()
+        writer = spec.open_writer(target, level, os.path.basename(path))
+        with open(path, 'rb') as source:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                original += len(chunk)
+        writer.close()
+        compress_seconds += time.perf_counter() - started
+        compressed += os.path.getsize(target)
+
+        started = time.perf_counter()
+        reader = READERS[codec](target)
+        while reader.read(CHUNK_SIZE):
+            pass
+        reader.close()
+        decompress_seconds += time.perf_counter() - started
+        os.remove(target)
+
+    return {
+        'codec': codec,
+        'level': level,
+        'ratio': round(compressed / original, 4) if original else None,
+        'compress_mb_s': round(original / 1e6 / compress_seconds, 1) if compress_seconds else None,
+        'decompress_mb_s': round(original / 1e6 / decompress_seconds, 1) if decompress_seconds else None,
+        'peak_memory_mb': round(max(_peak_rss_bytes() - baseline_rss, 0) / 1e6, 1),
+    }
+
+def _cell(value) -> str:
+    """Table text for a measurement; empty inputs leave some metrics as None."""
+    return '-' if value is None else str(value)
+
+class Command(BaseCommand):
+    help = 'Benchmark every codec and level over a corpus through the compress_file code path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--corpus', help='Directory with one subdirectory per content type')
+        parser.add_argument('--sample-size', type=int, default=16 * 1024 * 1024,
+                            help='Size of generated samples when --corpus is not given')
+        parser.add_argument('--codec', action='append', choices=sorted(CODECS))
+        parser.add_argument('--levels', help='Comma-separated levels to try instead of every level')
+        parser.add_argument('--min-speed', type=float, default=50.0,
+                            help='Compression MB/s a default must reach to be recommended')
+        parser.add_argument('--output', help='Write all results to this .csv or .json file')
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            if options['corpus']:
+                corpus = _load_corpus(options['corpus'])
+                if not corpus:
+                    raise CommandError('The corpus directory has no content-type subdirectories.')
+            else:
+                corpus = _generate_corpus(os.path.join(scratch_dir, 'corpus'), options['sample_size'])
+
+            combinations = []
+            for codec in options['codec'] or sorted(CODECS):
+                levels = list(CODECS[codec].levels) or [None]
+                if options['levels'] and CODECS[codec].levels:
+                    wanted = [int(level) for level in options['levels'].split(',')]
+                    levels = [level for level in levels if level in wanted]
+                combinations.extend((codec, level) for level in levels)
+
+            results = []
+            for content_type, paths in corpus.items():
+                self.stdout.write(f'\n{content_type} ({len(paths)} files)')
+                self.stdout.write(f'{"codec":<8} {"level":>5} {"ratio":>7} {"comp MB/s":>10} '
+                                  f'{"decomp MB/s":>12} {"peak MB":>8}')
+                for codec, level in combinations:
+                    # One process per combination isolates the memory high-water mark
+                    with ProcessPoolExecutor(max_workers=1) as pool:
+                        row = pool.submit(run_combination, codec, level, paths, scratch_dir).result()
+                    row['content_type'] = content_type
+                    results.append(row)
+                    self.stdout.write(
+                        f'{codec:<8} {_cell(level):>5} {_cell(row["ratio"]):>7} '
+                        f'{_cell(row["compress_mb_s"]):>10} {_cell(row["decompress_mb_s"]):>12} '
+                        f'{_cell(row["peak_memory_mb"]):>8}'
+                    )
+
+            self.stdout.write('\nSuggested defaults (best ratio at or above --min-speed):')
+            for content_type in corpus:
+                candidates = [row for row in results if row['content_type'] == content_type
+                              and row['ratio'] is not None
+                              and (row['compress_mb_s'] or 0) >= options['min_speed']]
+                if not candidates:
+                    self.stdout.write(f'  {content_type}: nothing reaches {options["min_speed"]} MB/s')
+                    continue
+                best = min(candidates, key=lambda row: row['ratio'])
+                self.stdout.write(f'  {content_type}: {best["codec"]} level {best["level"]} '
+                                  f'(ratio {best["ratio"]}, {best["compress_mb_s"]} MB/s)')
+
+        if options['output'] and not results:
+            self.stderr.write('No results to write; the corpus is empty.')
+        elif options['output']:
+            if options['output'].endswith('.json'):
+                with open(options['output'], 'w') as f:
+                    json.dump(results, f, indent=2)
+            else:
+                with open(options['output'], 'w', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=list(results[0]))
+                    writer.writeheader()
+                    writer.writerows(results)
+
+# Example:
+# python manage.py benchmark_codecs --corpus ~/compression-corpus --output results.csv
+# python manage.py benchmark_codecs --codec gzip --codec zstd --levels 1,3,6,9
+```
+
+This management command replaces guesswork about compression settings with measurements. It writes every file through each codec's `open_writer` in 64 KB chunks, which is the same path and chunk size that `compress_file` uses. It then reads the output back through a matching reader from `READERS`. Every codec and level is measured on every content type in the corpus. A corpus is a directory with one subdirectory per type, for example `text/`, `logs/`, `images/` and `binaries/`. Without one, the command generates seeded synthetic samples of each type. The report covers compression ratio, compression and decompression speed in MB/s, and peak memory. Each combination runs in a fresh process, so the resident-set high-water mark belongs to that combination alone. At the end the command suggests, per content type, the codec and level with the best ratio that still reaches `--min-speed`.
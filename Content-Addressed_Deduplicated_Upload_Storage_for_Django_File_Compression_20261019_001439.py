@@ -0,0 +1,229 @@
+Title: Content-Addressed Deduplicated Upload Storage for Django File Compression
+
+```python
+# settings.py
+# Standard Django settings; no extra packages are needed
+
+INSTALLED_APPS = [
+    # ...
+    'myapp',
+]
+
+# models.py in myapp
+# Every distinct upload is stored once as a Blob; UploadedFile and FileUpload
+# rows reference it and share its compressed artifact
+
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+def blob_path(sha256: str, suffix: str = '') -> str:
+    """Shard blobs by hash prefix so no directory grows without bound."""
+    return f'blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}{suffix}'
+
+class Blob(models.Model):
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.PositiveBigIntegerField()
+    original_file = models.FileField(max_length=200)
+    compressed_file = models.FileField(max_length=200, blank=True)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def release(self) -> None:
+        """
+        Drop one reference and delete the blob once nothing uses it.
+
+        The row stays locked until the files are gone, so store_upload,
+        which locks the same row before adding a reference, either revives
+        the blob first or waits and then stores the content afresh.
+        """
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(pk=self.pk).first()
+            if blob is None:
+                return
+            if blob.ref_count > 1:
+                Blob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') - 1)
+                return
+            blob.delete()
+            blob.original_file.delete(save=False)
+            if blob.compressed_file:
+                blob.compressed_file.delete(save=False)
+
+class UploadedFile(models.Model):
+    blob = models.ForeignKey(Blob, on_delete=models.PROTECT, related_name='uploaded_files')
+    original_name = models.CharField(max_length=255)
+    uploaded_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def original_file(self):
+        return self.blob.original_file
+
+    @property
+    def compressed_file(self):
+        return self.blob.compressed_file
+
+class FileUpload(models.Model):
+    blob = models.ForeignKey(Blob, on_delete=models.PROTECT, related_name='file_uploads')
+    original_name = models.CharField(max_length=255)
+
+    @property
+    def uploaded_file(self):
+        return self.blob.original_file
+
+@receiver(post_delete, sender=UploadedFile)
+@receiver(post_delete, sender=FileUpload)
+def release_blob(sender, instance, **kwargs):
+    instance.blob.release()
+
+# upload_handlers.py in myapp
+# Hash each file while Django is still receiving it
+
+import hashlib
+from django.core.files.uploadhandler import FileUploadHandler
+
+class HashingUploadHandler(FileUploadHandler):
+    """
+    Compute the SHA-256 of every uploaded file from the incoming chunks.
+
+    Chunks are passed on unchanged to the default handlers. The digests are
+    kept per field, in upload order, on `request.upload_digests`, so the
+    file never has to be read a second time just to hash it.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.digests = request.upload_digests = {}
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hasher.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        self.digests.setdefault(self.field_name, []).append(self.hasher.hexdigest())
+        return None
+
+# decorators.py in myapp
+# Installs HashingUploadHandler on the two upload views below
+
+import functools
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+
+def with_upload_handler(make_handler, csrf_protected=True):
+    """
+    Put `make_handler(request)` in front of Django's upload handlers for POSTs.
+
+    Handlers can only be changed before request.POST or request.FILES is
+    read, and CsrfViewMiddleware reads request.POST before the view runs.
+    The wrapper is therefore csrf_exempt and applies csrf_protect itself,
+    after the handler is installed, unless `csrf_protected` is False.
+    """
+    def decorator(view):
+        inner = csrf_protect(view) if csrf_protected else view
+
+        @csrf_exempt
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method == 'POST':
+                request.upload_handlers.insert(0, make_handler(request))
+            return inner(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# storage.py in myapp
+import os
+import zipfile
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from .models import Blob, blob_path
+
+def compress_blob(blob: Blob, arcname: str) -> None:
+    """Create the ZIP artifact for a newly stored blob."""
+    compressed_name = blob_path(blob.sha256, '.zip')
+    compressed_path = os.path.join(settings.MEDIA_ROOT, compressed_name)
+    os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
+    with zipfile.ZipFile(compressed_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.write(blob.original_file.path, arcname=arcname)
+    blob.compressed_file.name = compressed_name
+
+def store_upload(upload, sha256: str) -> Blob:
+    """
+    Return the blob for an upload, storing and compressing it only if new.
+
+    An existing blob is locked before its reference count goes up, so a
+    concurrent Blob.release() cannot delete it in between. A new blob row
+    is created inside the transaction, so a concurrent upload of the same
+    content waits on the unique index and then reuses the finished blob
+    instead of compressing it a second time.
+    """
+    with transaction.atomic():
+        blob = Blob.objects.select_for_update().filter(sha256=sha256).first()
+        if blob is None:
+            try:
+                with transaction.atomic():
+                    blob = Blob.objects.create(sha256=sha256, size=upload.size, ref_count=1)
+            except IntegrityError:
+                # Another upload of the same content created it first
+                blob = Blob.objects.select_for_update().get(sha256=sha256)
+            else:
+                blob.original_file.name = default_storage.save(blob_path(blob.sha256), upload)
+                compress_blob(blob, os.path.basename(upload.name))
+                blob.save(update_fields=['original_file', 'compressed_file'])
+                return blob
+        Blob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+    return blob
+
+# views.py in myapp
+from django.shortcuts import render, redirect
+from .decorators import with_upload_handler
+from .models import FileUpload, UploadedFile
+from .storage import store_upload
+from .upload_handlers import HashingUploadHandler
+
+@with_upload_handler(HashingUploadHandler)
+def upload_file(request):
+    if request.method == 'POST' and 'original_file' in request.FILES:
+        upload = request.FILES['original_file']
+        blob = store_upload(upload, request.upload_digests['original_file'][0])
+        uploaded_file = UploadedFile.objects.create(blob=blob, original_name=upload.name)
+        # The shared artifact lives under blobs/, so link to it directly
+        return redirect(uploaded_file.compressed_file.url)
+    return render(request, 'upload.html')
+
+@with_upload_handler(HashingUploadHandler)
+def upload_and_compress(request):
+    if request.method == 'POST' and 'uploaded_file' in request.FILES:
+        upload = request.FILES['uploaded_file']
+        blob = store_upload(upload, request.upload_digests['uploaded_file'][0])
+        FileUpload.objects.create(blob=blob, original_name=upload.name)
+        return redirect('upload_success')
+    return render(request, 'upload.html')
+
+# management/commands/dedupe_stats.py in myapp
+from django.core.management.base import BaseCommand
+from django.db.models import F, Sum
+from ...models import Blob
+
+class Command(BaseCommand):
+    help = 'Report how much storage content addressing saves'
+
+    def handle(self, *args, **options):
+        totals = Blob.objects.aggregate(
+            stored=Sum('size'),
+            logical=Sum(F('size') * F('ref_count')),
+        )
+        stored = totals['stored'] or 0
+        logical = totals['logical'] or 0
+        self.stdout.write(f'blobs: {Blob.objects.count()}')
+        self.stdout.write(f'stored bytes: {stored}')
+        self.stdout.write(f'bytes without deduplication: {logical}')
+        self.stdout.write(f'saved: {logical - stored}')
+```
+
+This storage layer makes both compression tools content-addressed. `HashingUploadHandler` computes a SHA-256 digest from the chunks as Django receives them, so no file is read twice just to be hashed. `store_upload` looks the digest up in the `Blob` table. New content is stored once under a hash-sharded path in `blobs/` and compressed once. A file that has been seen before only increments the blob's reference count and links straight to the existing ZIP. `UploadedFile` and `FileUpload` rows point at their blob, and deleting a row releases its reference. The last release removes both the original and the compressed artifact. Releasing and storing both lock the blob row first, so an upload that arrives while the last reference is being dropped either keeps the blob alive or stores the content again. It never points at a deleted blob.
@@ -0,0 +1,251 @@
+Title: Content-Hash Merge Result Cache for Django PDF Merging
+
+```python
+# Install necessary package
+# pip install PyPDF2
+
+# settings.py
+# Location and limits of the on-disk merge result cache
+
+PDF_MERGE_CACHE_DIR = os.path.join(MEDIA_ROOT, 'merge_cache')
+PDF_MERGE_CACHE_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+PDF_MERGE_CACHE_MAX_ENTRIES = 5000
+
+# models.py
+from django.db import models
+
+class MergeCacheStats(models.Model):
+    """Running hit/miss counters for the merge result cache."""
+    name = models.CharField(max_length=50, unique=True, default='default')
+    hits = models.PositiveBigIntegerField(default=0)
+    misses = models.PositiveBigIntegerField(default=0)
+    evictions = models.PositiveBigIntegerField(default=0)
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+# merge_cache.py
+import hashlib
+import os
+import threading
+import time
+from typing import BinaryIO, Callable, Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import F
+
+from .models import MergeCacheStats
+
+def hash_upload(uploaded_file) -> str:
+    """Return the SHA-256 of an uploaded file without loading it whole."""
+    hasher = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        hasher.update(chunk)
+    uploaded_file.seek(0)
+    return hasher.hexdigest()
+
+def merge_key(content_hashes: Iterable[str]) -> str:
+    """Build the cache key from the ordered list of input content hashes."""
+    return hashlib.sha256('\n'.join(content_hashes).encode('ascii')).hexdigest()
+
+class MergeResultCache:
+    """
+    On-disk cache of merged PDFs keyed by the ordered input content hashes.
+
+    Entries are plain files named after their key. A hit bumps the file's
+    modification time, so the oldest mtime is always the least recently
+    used entry and is evicted first once the size or entry limit is hit.
+
+    get() and put() hand out open files rather than paths: an entry evicted
+    by a concurrent request disappears from the directory, but a response
+    that already holds it open can still stream it.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_entries: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pdf')
+
+    def get(self, key: str) -> Optional[BinaryIO]:
+        """Return the cached result opened for reading, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            cached_file = open(path, 'rb')
+        except FileNotFoundError:
+            self._record(misses=1)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # evicted since it was opened; the open file is still complete
+        self._record(hits=1)
+        return cached_file
+
+    def put(self, key: str, data: bytes) -> BinaryIO:
+        """Store a merged PDF atomically, open it, then evict old entries if needed."""
+        path = self.path_for(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+        cached_file = open(path, 'rb')
+        self.evict(keep=path)
+        return cached_file
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Remove least recently used entries, except `keep`, until both limits are met."""
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith('.pdf'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            entries.sort()
+
+            total = sum(size for _, size, _ in entries)
+            count = len(entries)
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_bytes and count <= self.max_entries:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                count -= 1
+                removed += 1
+        if removed:
+            self._record(evictions=removed)
+        return removed
+
+    def _record(self, hits=0, misses=0, evictions=0) -> None:
+        counters = {
+            'hits': F('hits') + hits,
+            'misses': F('misses') + misses,
+            'evictions': F('evictions') + evictions,
+        }
+        # One query per lookup; the row is only created the first time
+        if not MergeCacheStats.objects.filter(name='default').update(**counters):
+            MergeCacheStats.objects.get_or_create(name='default')
+            MergeCacheStats.objects.filter(name='default').update(**counters)
+
+_cache: Optional[MergeResultCache] = None
+
+def get_merge_cache() -> MergeResultCache:
+    global _cache
+    if _cache is None:
+        _cache = MergeResultCache(
+            settings.PDF_MERGE_CACHE_DIR,
+            settings.PDF_MERGE_CACHE_MAX_BYTES,
+            settings.PDF_MERGE_CACHE_MAX_ENTRIES,
+        )
+    return _cache
+
+def cached_merge(files: List, merge: Callable[[List], bytes]) -> BinaryIO:
+    """
+    Return the merged PDF for the given uploads, opened for reading.
+
+    The inputs are only hashed on the way in; `merge` is called to parse and
+    merge them only when no result for the same ordered inputs is cached.
+    """
+    cache = get_merge_cache()
+    key = merge_key(hash_upload(f) for f in files)
+    merged_file = cache.get(key)
+    if merged_file is None:
+        merged_file = cache.put(key, merge(files))
+    return merged_file
+
+# pdf_utils.py
+import io
+from PyPDF2 import PdfMerger
+
+def merge_pdfs_to_bytes(pdf_files) -> bytes:
+    """Merge the uploaded PDF files in order and return the merged bytes."""
+    pdf_merger = PdfMerger()
+    for pdf_file in pdf_files:
+        pdf_merger.append(pdf_file)
+    merged_pdf_stream = io.BytesIO()
+    pdf_merger.write(merged_pdf_stream)
+    pdf_merger.close()
+    return merged_pdf_stream.getvalue()
+
+# views.py
+from typing import List
+from django import forms
+from django.core.files.uploadedfile import UploadedFile
+from django.http import FileResponse, HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.views import View
+from .merge_cache import cached_merge
+from .models import MergeCacheStats
+from .pdf_utils import merge_pdfs_to_bytes
+
+def merged_pdf_response(merged_file) -> FileResponse:
+    # FileResponse closes the file once it has been sent
+    return FileResponse(
+        merged_file,
+        as_attachment=True,
+        filename='merged_document.pdf',
+        content_type='application/pdf',
+    )
+
+def merge_pdf_view(request):
+    """
+    Handle the PDF merging request and return the merged PDF response.
+    """
+    if request.method == 'POST' and request.FILES.getlist('pdf_files'):
+        pdf_files = request.FILES.getlist('pdf_files')
+        merged_file = cached_merge(pdf_files, merge_pdfs_to_bytes)
+        return merged_pdf_response(merged_file)
+
+    return render(request, 'merge_pdf.html')
+
+class PDFUploadForm(forms.Form):
+    pdf_files = forms.FileField(widget=forms.ClearableFileInput(attrs={'multiple': True}))
+
+class PDFMergerView(View):
+    # Handles GET request
+    def get(self, request) -> HttpResponse:
+        form = PDFUploadForm()
+        return render(request, 'merge_pdfs.html', {'form': form})
+
+    # Handles POST request, reusing a cached result for repeated inputs
+    def post(self, request) -> HttpResponse:
+        form = PDFUploadForm(request.POST, request.FILES)
+        if form.is_valid():
+            files: List[UploadedFile] = request.FILES.getlist('pdf_files')
+            merged_file = cached_merge(files, merge_pdfs_to_bytes)
+            return merged_pdf_response(merged_file)
+        return render(request, 'merge_pdfs.html', {'form': form})
+
+def merge_cache_stats(request):
+    """Report the hit rate of the merge result cache."""
+    stats, _ = MergeCacheStats.objects.get_or_create(name='default')
+    return JsonResponse({
+        'hits': stats.hits,
+        'misses': stats.misses,
+        'evictions': stats.evictions,
+        'hit_rate': round(stats.hit_rate(), 4),
+    })
+
+# urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('merge-pdfs/', views.merge_pdf_view, name='merge_pdf_view'),
+    path('merge/', views.PDFMergerView.as_view(), name='merge_pdfs'),
+    path('merge-cache/stats/', views.merge_cache_stats, name='merge_cache_stats'),
+]
+```
+
+This module puts a content-addressed cache in front of both `merge_pdf_view` and `PDFMergerView`. Each upload is hashed with SHA-256 while it is read in chunks, and the ordered list of hashes forms the cache key. A repeated request for the same files in the same order is answered from disk without parsing any PDF. Cached results are stored as plain files in `PDF_MERGE_CACHE_DIR`. A hit bumps the file's modification time, and eviction removes the least recently used files once the total size or entry count goes over its limit. Results are opened before any eviction runs, and the entry just written is never evicted, so a response never loses the file it is about to stream. The counters cost one `UPDATE` per lookup. Hits, misses and evictions are counted in the database and exposed at `merge-cache/stats/`.
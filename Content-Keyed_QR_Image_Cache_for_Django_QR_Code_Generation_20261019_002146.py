@@ -0,0 +1,194 @@
+Title: Content-Keyed QR Image Cache for Django QR Code Generation
+
+```python
+# settings.py
+# pip install pillow qrcode opencv-python-headless
+
+INSTALLED_APPS = [
+    # ...
+    'qr_code_app',
+]
+
+# Number of cache keys remembered in memory per process
+QR_CACHE_MEMORY_ENTRIES = 10000
+
+# qr_code_app/qr_cache.py
+# Render each (data, size, error correction) combination once
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from django.conf import settings
+
+CACHE_DIR = 'qr_codes/cache'
+
+class _LRU:
+    """A small thread-safe LRU mapping cache keys to stored image names."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            name = self._items.get(key)
+            if name is not None:
+                self._items.move_to_end(key)
+            return name
+
+    def put(self, key, name):
+        with self._lock:
+            self._items[key] = name
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+_memory = _LRU(getattr(settings, 'QR_CACHE_MEMORY_ENTRIES', 10000))
+
+def cache_key(data: str, size, error_correction: str) -> str:
+    payload = f'{size}\0{error_correction}\0{data}'.encode()
+    return hashlib.sha256(payload).hexdigest()
+
+def cached_image_name(data: str, size, error_correction: str,
+                      render: Callable[[], bytes]) -> str:
+    """
+    Return the media name of the PNG for these options, rendering it only once.
+
+    Lookups go to the in-memory LRU first and then to the file named by the
+    key under qr_codes/cache/. Only a miss in both calls `render`. The file
+    is written to a temporary name and renamed into place, so concurrent
+    misses for the same key can both render but never expose a partial file.
+    """
+    key = cache_key(data, size, error_correction)
+    name = _memory.get(key)
+    if name is not None:
+        return name
+
+    name = f'{CACHE_DIR}/{key[:2]}/{key}.png'
+    path = os.path.join(settings.MEDIA_ROOT, name)
+    if not os.path.exists(path):
+        png = render()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    _memory.put(key, name)
+    return name
+
+# qr_code_app/views.py
+# (project from "Django Application for Generating and Scanning QR Codes")
+
+import io
+import qrcode
+from django.shortcuts import render, redirect
+from .models import QRCode
+from .qr_cache import cached_image_name
+
+ERROR_CORRECTION = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H,
+}
+
+def render_qr_png(data, box_size=10, error_correction='M'):
+    qr = qrcode.QRCode(box_size=box_size, error_correction=ERROR_CORRECTION[error_correction])
+    qr.add_data(data)
+    buffer = io.BytesIO()
+    qr.make_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def generate_qr_code(request):
+    # View to generate a QR code; identical requests share one stored image
+    if request.method == 'POST':
+        name = request.POST['name']
+        data = request.POST['data']
+        error_correction = request.POST.get('error_correction', 'M')
+        if error_correction not in ERROR_CORRECTION:
+            error_correction = 'M'
+        box_size = 10
+
+        image_name = cached_image_name(
+            data, box_size, error_correction,
+            lambda: render_qr_png(data, box_size, error_correction),
+        )
+        # The row points at the shared file instead of saving a copy
+        QRCode.objects.create(name=name, data=data, qr_image=image_name)
+        return redirect('qr_list')
+
+    return render(request, 'qr_code_app/generate.html')
+
+# qr_code_app/views.py
+# (project from "Django Project for QR Code Generation and Scanning with Mobile-First Approach")
+
+import io
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from django_qr_code.qrcode.utils import QRCodeOptions
+from django_qr_code.qrcode.maker import make_qr_code_image
+from .models import QRCode
+from .qr_cache import cached_image_name
+
+# Named sizes of django-qr-code (tiny to huge) and the four QR error-correction levels
+QR_SIZES = {'t', 's', 'm', 'l', 'h'}
+QR_ERROR_CORRECTION = {'L', 'M', 'Q', 'H'}
+
+class QRCodeView(APIView):
+    """
+    API View to handle QR Code generation
+    """
+    def post(self, request):
+        data = request.data.get('data')
+        if not data:
+            return Response({"error": "data is required"}, status=status.HTTP_400_BAD_REQUEST)
+        # Only known options reach the renderer and the cache key, so a bad
+        # value is a 400 rather than a 500 and cannot create a new cache entry
+        size = str(request.data.get('size', 't')).lower()
+        error_correction = str(request.data.get('error_correction', 'M')).upper()
+        if size not in QR_SIZES:
+            return Response({"error": f"size must be one of {', '.join(sorted(QR_SIZES))}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if error_correction not in QR_ERROR_CORRECTION:
+            return Response({"error": "error_correction must be one of L, M, Q, H"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        def render_png():
+            options = QRCodeOptions(size=size, error_correction=error_correction)
+            buffer = io.BytesIO()
+            make_qr_code_image(data, qr_code_options=options).save(buffer, format='PNG')
+            return buffer.getvalue()
+
+        image_name = cached_image_name(data, size, error_correction, render_png)
+        # Created only once the image exists, so a failed render leaves no row
+        qr_code = QRCode.objects.create(data=data)
+        response = {
+            "qr_code": qr_code.id,
+            "qr_image_path": f"{settings.MEDIA_URL}{image_name}",
+        }
+        return Response(response, status=status.HTTP_201_CREATED)
+
+    def get(self, request, pk):
+        try:
+            qr_code = QRCode.objects.get(id=pk)
+            response = {
+                "data": qr_code.data,
+                "created_at": qr_code.created_at
+            }
+            return Response(response, status=status.HTTP_200_OK)
+        except QRCode.DoesNotExist:
+            return Response({"error": "QR code not found"}, status=status.HTTP_404_NOT_FOUND)
+```
+
+Both QR projects rendered and saved a new image on every request, even for data that had already been encoded many times. With this change, an image is rendered once per combination of data, size and error-correction level. The cache key is the SHA-256 of those three values. `cached_image_name` first checks a per-process in-memory LRU that maps keys to stored file names. On a miss there, it checks for the file named after the key under `media/qr_codes/cache/`. Only when both miss does it call the renderer. The PNG is then written to a temporary file and renamed into place, so concurrent requests never see a partial image. `generate_qr_code` still creates a `QRCode` row for every request, but the row's `qr_image` now points at the shared file. It also now saves a real PNG instead of the raw pixel bytes from `tobytes()`. `QRCodeView.post` returns the URL of the cached image in `qr_image_path` instead of writing `media/qr_codes/<id>.png` for every request. It checks `size` and `error_correction` against the allowed values and returns a 400 for anything else. Its row is created only after the image has been rendered or found in the cache.
@@ -0,0 +1,190 @@
+Title: Fast-Path QR Code Scanning Pipeline with Benchmark in Django
+
+```python
+# settings.py
+# pip install pillow qrcode opencv-python-headless numpy
+
+INSTALLED_APPS = [
+    # ...
+    'qr_code_app',
+]
+
+# Photos whose longer side exceeds this are downscaled before detection
+QR_SCAN_MAX_DIMENSION = 1280
+
+# qr_code_app/scanning.py
+# Decode uploads to grayscale without copying and reuse one detector per thread
+
+import mmap
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import cv2
+import numpy as np
+from django.conf import settings
+
+_local = threading.local()
+
+class ScanResult(NamedTuple):
+    data: Optional[str]
+    scale: float           # 1.0 when the image was scanned at full size
+    seconds: float
+
+def get_detector() -> cv2.QRCodeDetector:
+    """Each worker thread builds its detector once and keeps it."""
+    detector = getattr(_local, 'detector', None)
+    if detector is None:
+        detector = _local.detector = cv2.QRCodeDetector()
+    return detector
+
+def decode_grayscale(buffer) -> Optional[np.ndarray]:
+    """Decode encoded image bytes (any buffer object) straight to one channel."""
+    array = np.frombuffer(buffer, dtype=np.uint8)
+    if array.size == 0:
+        return None
+    return cv2.imdecode(array, cv2.IMREAD_GRAYSCALE)
+
+def _detect(image) -> Optional[str]:
+    data, points, _ = get_detector().detectAndDecode(image)
+    return data if points is not None and data else None
+
+def scan_image(image: np.ndarray, max_dimension: Optional[int] = None) -> ScanResult:
+    """
+    Detect and decode one QR code in a grayscale image.
+
+    Images larger than `max_dimension` are first scanned downscaled, which
+    is where most of the detector's time goes on phone photos. If that finds
+    nothing, e.g. a small code in a large frame, the full image is tried.
+    """
+    started = time.perf_counter()
+    max_dimension = max_dimension or settings.QR_SCAN_MAX_DIMENSION
+    height, width = image.shape[:2]
+    scale = min(1.0, max_dimension / max(height, width))
+    if scale < 1.0:
+        small = cv2.resize(image, (round(width * scale), round(height * scale)),
+                           interpolation=cv2.INTER_AREA)
+        data = _detect(small)
+        if data is not None:
+            return ScanResult(data, scale, time.perf_counter() - started)
+    return ScanResult(_detect(image), 1.0, time.perf_counter() - started)
+
+def scan_upload(uploaded_file) -> Optional[ScanResult]:
+    """
+    Scan an UploadedFile without copying its bytes.
+
+    In-memory uploads expose their BytesIO buffer directly; uploads that
+    Django spooled to a temporary file are memory-mapped.
+    """
+    source = getattr(uploaded_file, 'file', uploaded_file)
+    if hasattr(source, 'getbuffer'):
+        image = decode_grayscale(source.getbuffer())
+    else:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            image = decode_grayscale(mapped)
+    if image is None:
+        return None
+    return scan_image(image)
+
+# qr_code_app/views.py
+from django.http import HttpResponse
+from django.shortcuts import render
+from .scanning import scan_upload
+
+def scan_qr_code(request):
+    # Function to scan a QR code from an image
+    if request.method == 'POST':
+        file = request.FILES['qr_image']
+        result = scan_upload(file)
+        if result is None:
+            return HttpResponse('The upload is not a readable image.', status=400)
+        return HttpResponse(f"Scanned Data: {result.data or ''}")
+
+    return render(request, 'qr_code_app/scan.html')
+
+# qr_code_app/management/commands/benchmark_qr_scan.py
+import csv
+import os
+import random
+import time
+
+import cv2
+import numpy as np
+import qrcode
+from django.core.management.base import BaseCommand
+
+from ...scanning import decode_grayscale, scan_image
+
+def legacy_scan(encoded: bytes):
+    """The original scan_qr_code path: copied buffer, color decode, new detector."""
+    # np.fromstring copies; frombuffer(...).copy() does the same without the deprecation
+    img_array = np.frombuffer(encoded, np.uint8).copy()
+    img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+    detector = cv2.QRCodeDetector()
+    data, _, _ = detector.detectAndDecode(img)
+    return data or None
+
+def fast_scan(encoded: bytes):
+    return scan_image(decode_grayscale(encoded)).data
+
+def synthetic_photos(count, width, height, seed=7):
+    """Yield (jpeg bytes, expected data): a QR code placed in a noisy photo-sized frame."""
+    rng = random.Random(seed)
+    for number in range(count):
+        expected = f'TICKET-{number:06d}-{rng.randrange(10 ** 8):08d}'
+        code = np.array(qrcode.make(expected, box_size=rng.randint(6, 14)).convert('L'))
+        frame = np.random.default_rng(number).normal(128, 40, (height, width)).clip(0, 255).astype(np.uint8)
+        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        y = rng.randrange(0, height - code.shape[0])
+        x = rng.randrange(0, width - code.shape[1])
+        frame[y:y + code.shape[0], x:x + code.shape[1]] = code
+        ok, jpeg = cv2.imencode('.jpg', cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR),
+                                [cv2.IMWRITE_JPEG_QUALITY, 85])
+        yield jpeg.tobytes(), expected
+
+def labelled_photos(labels_path):
+    """Read `file,data` rows; file paths are relative to the CSV."""
+    root = os.path.dirname(os.path.abspath(labels_path))
+    with open(labels_path, newline='') as f:
+        for row in csv.DictReader(f):
+            with open(os.path.join(root, row['file']), 'rb') as image:
+                yield image.read(), row['data']
+
+class Command(BaseCommand):
+    help = 'Compare scans/sec and accuracy of the legacy and fast QR scanning paths'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--labels', help='CSV with file and data columns for real photos')
+        parser.add_argument('--count', type=int, default=50, help='Synthetic photos to generate')
+        parser.add_argument('--width', type=int, default=4032)
+        parser.add_argument('--height', type=int, default=3024)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        if options['labels']:
+            samples = list(labelled_photos(options['labels']))
+        else:
+            samples = list(synthetic_photos(options['count'], options['width'], options['height']))
+        self.stdout.write(f'{len(samples)} images, best of {options["repeat"]} runs')
+
+        for label, scan in (('legacy', legacy_scan), ('fast', fast_scan)):
+            best = None
+            correct = 0
+            for _ in range(options['repeat']):
+                correct = 0
+                started = time.perf_counter()
+                for encoded, expected in samples:
+                    correct += scan(encoded) == expected
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            self.stdout.write(
+                f'{label:<7} {len(samples) / best:8.1f} scans/s   '
+                f'accuracy {correct}/{len(samples)} ({100 * correct / len(samples):.1f}%)'
+            )
+
+# Example:
+# python manage.py benchmark_qr_scan
+# python manage.py benchmark_qr_scan --labels ~/qr-photos/labels.csv
+```
+
+This replaces the scanning path in `scan_qr_code`. The old version copied the upload with the deprecated `np.fromstring`, decoded all three colour channels and built a new `cv2.QRCodeDetector` on every request. Now in-memory uploads are read through their `BytesIO` buffer and spooled uploads are memory-mapped. The bytes reach `cv2.imdecode` through `np.frombuffer` without a copy and are decoded directly to grayscale, the only channel the detector uses. Each worker thread builds one detector and reuses it. Phone photos larger than `QR_SCAN_MAX_DIMENSION` are first scanned at a reduced size with area interpolation. The full-resolution image is tried only when that finds nothing, so a small code in a large frame is still read. The `benchmark_qr_scan` command runs the old and new paths over the same images. By default it uses seeded synthetic photo-sized JPEGs, and with `--labels` it uses real photos listed in a labelled CSV. For each path it reports scans per second and accuracy against the expected payloads.
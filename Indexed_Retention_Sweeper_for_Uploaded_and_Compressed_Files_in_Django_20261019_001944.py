@@ -0,0 +1,228 @@
+Title: Indexed Retention Sweeper for Uploaded and Compressed Files in Django
+
+```python
+# settings.py
+# Retention settings for the file compression tools
+
+MEDIA_RETENTION_DAYS = 30
+RETENTION_BATCH_SIZE = 500
+
+# models.py in myapp
+# Files are spread over hashed subdirectories and rows carry an indexed
+# upload time, so expired rows are found by an index range scan instead of
+# a directory walk
+
+import os
+import uuid
+from django.db import models
+from django.utils import timezone
+
+def shard_name(prefix: str, filename: str) -> str:
+    """Return prefix/ab/cd/<token>_<filename>; 65,536 leaf directories keep each one small."""
+    token = uuid.uuid4().hex
+    return f'{prefix}/{token[:2]}/{token[2:4]}/{token}_{os.path.basename(filename)}'
+
+def upload_path(instance, filename):
+    return shard_name('uploads', filename)
+
+class UploadedFile(models.Model):
+    original_file = models.FileField(upload_to=upload_path, max_length=200)
+    compressed_file = models.FileField(upload_to='compressed/', max_length=200, blank=True, null=True)
+    uploaded_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+class FileUpload(models.Model):
+    uploaded_file = models.FileField(upload_to=upload_path, max_length=200)
+    # default rather than auto_now_add so existing rows can be migrated
+    uploaded_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    @property
+    def zip_name(self) -> str:
+        """The archive compress_file writes next to the upload."""
+        return f'{os.path.splitext(self.uploaded_file.name)[0]}.zip'
+
+# views.py in myapp
+# Compressed archives are sharded the same way as the uploads
+
+import os
+import zipfile
+from django.conf import settings
+from django.http import FileResponse, Http404
+from .models import shard_name
+
+def compress_file(uploaded_file):
+    compressed_name = shard_name('compressed', f'{os.path.basename(uploaded_file.original_file.name)}.zip')
+    compressed_path = os.path.join(settings.MEDIA_ROOT, compressed_name)
+    os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
+    with zipfile.ZipFile(compressed_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.write(uploaded_file.original_file.path, arcname=os.path.basename(uploaded_file.original_file.name))
+    uploaded_file.compressed_file.name = compressed_name
+    uploaded_file.save(update_fields=['compressed_file'])
+
+def download_file(request, file_name):
+    """`file_name` is the path below compressed/, e.g. 3f/a2/<token>_report.pdf.zip."""
+    root = os.path.realpath(os.path.join(settings.MEDIA_ROOT, 'compressed'))
+    file_abs_path = os.path.realpath(os.path.join(root, file_name))
+    if not file_abs_path.startswith(root + os.sep) or not os.path.isfile(file_abs_path):
+        raise Http404('File not found.')
+    return FileResponse(open(file_abs_path, 'rb'), as_attachment=True,
+                        filename=os.path.basename(file_abs_path))
+
+# In upload_file, redirect with the path below compressed/:
+#     return redirect('download_file',
+#                     file_name=os.path.relpath(uploaded_file.compressed_file.name, 'compressed'))
+
+# urls.py in myapp
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.upload_file, name='upload_file'),
+    # path: converter, since sharded names contain slashes
+    path('download/<path:file_name>/', views.download_file, name='download_file'),
+]
+
+# retention.py in myapp
+# Batched deletion of expired rows and their files
+
+import logging
+from typing import Callable, Iterable, NamedTuple
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+class SweepResult(NamedTuple):
+    rows: int
+    files: int
+    bytes_reclaimed: int
+
+def _delete_file(name: str) -> int:
+    """Delete one stored file and return its size; missing files count as 0."""
+    try:
+        size = default_storage.size(name)
+        default_storage.delete(name)
+    except FileNotFoundError:
+        return 0
+    return size
+
+def sweep(queryset, file_names: Callable[[object], Iterable[str]],
+          batch_size: int, dry_run: bool = False) -> SweepResult:
+    """
+    Delete the rows in `queryset` oldest first, `batch_size` at a time.
+
+    `queryset` must filter on the indexed `uploaded_at` column, so each batch
+    is an index range scan from the oldest row. Rows are deleted before their
+    files: a crash part-way through leaves at most one batch of unreferenced
+    files, never rows that point at missing files.
+    """
+    rows = files = reclaimed = 0
+    queryset = queryset.order_by('uploaded_at', 'pk')
+
+    if dry_run:
+        for row in queryset.iterator(chunk_size=batch_size):
+            rows += 1
+            for name in filter(None, file_names(row)):
+                if default_storage.exists(name):
+                    files += 1
+                    reclaimed += default_storage.size(name)
+        return SweepResult(rows, files, reclaimed)
+
+    while True:
+        batch = list(queryset[:batch_size])
+        if not batch:
+            break
+        names = [name for row in batch for name in file_names(row) if name]
+        with transaction.atomic():
+            queryset.model.objects.filter(pk__in=[row.pk for row in batch]).delete()
+        for name in names:
+            try:
+                size = _delete_file(name)
+            except OSError:
+                logger.exception('Could not delete %s', name)
+                continue
+            if size:
+                files += 1
+                reclaimed += size
+        rows += len(batch)
+    return SweepResult(rows, files, reclaimed)
+
+def uploaded_file_names(row):
+    return [row.original_file.name, row.compressed_file.name if row.compressed_file else None]
+
+def file_upload_names(row):
+    return [row.uploaded_file.name, row.zip_name]
+
+# management/commands/sweep_media.py in myapp
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from ...models import FileUpload, UploadedFile
+from ...retention import file_upload_names, sweep, uploaded_file_names
+
+class Command(BaseCommand):
+    help = 'Delete uploads and compressed files older than the retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.MEDIA_RETENTION_DAYS)
+        parser.add_argument('--batch-size', type=int, default=settings.RETENTION_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        targets = [
+            ('UploadedFile', UploadedFile.objects.filter(uploaded_at__lt=cutoff), uploaded_file_names),
+            ('FileUpload', FileUpload.objects.filter(uploaded_at__lt=cutoff), file_upload_names),
+        ]
+        total = 0
+        for label, queryset, file_names in targets:
+            result = sweep(queryset, file_names, options['batch_size'], options['dry_run'])
+            total += result.bytes_reclaimed
+            self.stdout.write(f'{label}: {result.rows} rows, {result.files} files, '
+                              f'{result.bytes_reclaimed / 1e6:.1f} MB')
+        verb = 'would be reclaimed' if options['dry_run'] else 'reclaimed'
+        self.stdout.write(self.style.SUCCESS(f'{total / 1e6:.1f} MB {verb}'))
+
+# management/commands/shard_media.py in myapp
+# One-off move of files saved before sharding into hashed subdirectories
+
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from ...models import FileUpload, UploadedFile, shard_name
+
+def _move(name: str, prefix: str) -> str:
+    new_name = shard_name(prefix, name)
+    new_path = os.path.join(settings.MEDIA_ROOT, new_name)
+    os.makedirs(os.path.dirname(new_path), exist_ok=True)
+    os.replace(os.path.join(settings.MEDIA_ROOT, name), new_path)
+    return new_name
+
+class Command(BaseCommand):
+    help = 'Move files stored directly in uploads/ and compressed/ into hashed subdirectories'
+
+    def handle(self, *args, **options):
+        moved = 0
+        flat_uploads = r'^uploads/[^/]+$'
+        for row in UploadedFile.objects.filter(original_file__regex=flat_uploads).iterator():
+            row.original_file.name = _move(row.original_file.name, 'uploads')
+            if row.compressed_file and row.compressed_file.name.count('/') == 1:
+                row.compressed_file.name = _move(row.compressed_file.name, 'compressed')
+            row.save(update_fields=['original_file', 'compressed_file'])
+            moved += 1
+        for row in FileUpload.objects.filter(uploaded_file__regex=flat_uploads).iterator():
+            old_zip = row.zip_name
+            row.uploaded_file.name = _move(row.uploaded_file.name, 'uploads')
+            if os.path.exists(os.path.join(settings.MEDIA_ROOT, old_zip)):
+                os.replace(os.path.join(settings.MEDIA_ROOT, old_zip),
+                           os.path.join(settings.MEDIA_ROOT, row.zip_name))
+            row.save(update_fields=['uploaded_file'])
+            moved += 1
+        self.stdout.write(self.style.SUCCESS(f'Moved files for {moved} rows'))
+
+# Run daily, e.g. from cron:
+# 0 3 * * * cd /srv/app && python manage.py sweep_media
+# python manage.py sweep_media --days 7 --dry-run
+```
+
+Both compression tools used to keep every upload and archive forever, in two flat directories that grew slower to list with each file. This adds a retention subsystem. `uploaded_at` is indexed on `UploadedFile` and is added, also indexed, to `FileUpload`. The indexed column acts as an expiry queue. `sweep_media` takes expired rows oldest first, `RETENTION_BATCH_SIZE` at a time, through an index range scan. It never walks a directory. Each batch of rows is deleted in a short transaction, and then the batch's original and compressed files are removed. If the command crashes part-way, at most one batch of files is left unreferenced, and no row ever points at a missing file. The command reports the rows, files and bytes reclaimed, and `--dry-run` reports the same figures without deleting anything. New uploads and archives are saved under hashed subdirectories such as `uploads/3f/a2/`, so every directory stays small. The one-off `shard_media` command moves files saved before this change into the same layout.
@@ -0,0 +1,155 @@
+Title: Listing and Extracting Single Entries from Compressed Archives in Django
+
+```python
+# urls.py in myapp
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.upload_file, name='upload_file'),
+    path('download/<path:file_name>/', views.download_file, name='download_file'),
+    path('archives/<path:file_name>/entries/', views.list_archive, name='list_archive'),
+    path('archives/<path:file_name>/entry/', views.extract_entry, name='extract_entry'),
+]
+
+# archive_index.py in myapp
+# Read ZIP archives through their central directory only
+
+import functools
+import os
+import struct
+import zipfile
+from typing import Dict
+
+LOCAL_HEADER_SIZE = 30
+LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+class ArchiveError(Exception):
+    """The archive or the requested entry cannot be read."""
+
+@functools.lru_cache(maxsize=256)
+def _central_directory(path: str, mtime_ns: int, size: int) -> Dict[str, zipfile.ZipInfo]:
+    # ZipFile seeks to the end-of-central-directory record and reads only the
+    # directory itself; no entry data is touched. The stat values are part of
+    # the key so a replaced archive is read again.
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return {info.filename: info for info in archive.infolist()}
+    except zipfile.BadZipFile as e:
+        raise ArchiveError(str(e)) from e
+
+def central_directory(path: str) -> Dict[str, zipfile.ZipInfo]:
+    """Return the archive's entries by name, cached until the file changes."""
+    stat = os.stat(path)
+    return _central_directory(path, stat.st_mtime_ns, stat.st_size)
+
+def open_entry(path: str, name: str):
+    """
+    Open one entry for streaming decompression.
+
+    Seeks straight to the entry's local header using the offset from the
+    cached central directory, skips the header and returns a file-like
+    reader that decompresses and checks the CRC as it is read. Only the
+    bytes of this entry are read from disk.
+    """
+    info = central_directory(path).get(name)
+    if info is None:
+        raise ArchiveError(f'No entry named {name!r}')
+    if info.is_dir():
+        raise ArchiveError(f'{name!r} is a directory')
+    if info.flag_bits & 0x1:
+        raise ArchiveError(f'{name!r} is encrypted')
+
+    f = open(path, 'rb')
+    try:
+        f.seek(info.header_offset)
+        header = f.read(LOCAL_HEADER_SIZE)
+        if len(header) != LOCAL_HEADER_SIZE or header[:4] != LOCAL_HEADER_SIGNATURE:
+            raise ArchiveError(f'Bad local header for {name!r}')
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        f.seek(name_length + extra_length, os.SEEK_CUR)
+        # The same reader ZipFile.open() returns, minus re-reading the directory
+        return zipfile.ZipExtFile(f, 'r', info, close_fileobj=True)
+    except Exception:
+        f.close()
+        raise
+
+# views.py in myapp
+import mimetypes
+import os
+from django.conf import settings
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from .archive_index import ArchiveError, central_directory, open_entry
+
+CHUNK_SIZE = 64 * 1024
+MAX_LISTED_ENTRIES = 5000
+
+def _archive_path(file_name):
+    root = os.path.realpath(os.path.join(settings.MEDIA_ROOT, 'compressed'))
+    path = os.path.realpath(os.path.join(root, file_name))
+    if not path.startswith(root + os.sep) or not path.endswith('.zip') or not os.path.isfile(path):
+        raise Http404('Archive not found.')
+    return path
+
+def list_archive(request, file_name):
+    """List entries with their sizes; `?prefix=` narrows the listing to one folder."""
+    try:
+        entries = central_directory(_archive_path(file_name))
+    except ArchiveError as e:
+        return JsonResponse({'error': str(e)}, status=422)
+
+    prefix = request.GET.get('prefix', '')
+    listed = []
+    for info in entries.values():
+        if not info.filename.startswith(prefix):
+            continue
+        if len(listed) == MAX_LISTED_ENTRIES:
+            break
+        listed.append({
+            'name': info.filename,
+            'size': info.file_size,
+            'compressed_size': info.compress_size,
+            'is_dir': info.is_dir(),
+            'modified': '%04d-%02d-%02dT%02d:%02d:%02d' % info.date_time,
+        })
+    return JsonResponse({
+        'archive': file_name,
+        'entry_count': len(entries),
+        'total_size': sum(info.file_size for info in entries.values()),
+        'entries': listed,
+        'truncated': len(listed) == MAX_LISTED_ENTRIES,
+    })
+
+def _stream(reader):
+    try:
+        while True:
+            chunk = reader.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        reader.close()
+
+def extract_entry(request, file_name):
+    """Stream one decompressed entry, named by `?name=`, without reading the rest."""
+    name = request.GET.get('name')
+    if not name:
+        return JsonResponse({'error': 'name is required'}, status=400)
+    path = _archive_path(file_name)
+    try:
+        reader = open_entry(path, name)
+    except ArchiveError as e:
+        return JsonResponse({'error': str(e)}, status=404)
+
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    response = StreamingHttpResponse(_stream(reader), content_type=content_type)
+    response['Content-Length'] = str(central_directory(path)[name].file_size)
+    response['Content-Disposition'] = f'attachment; filename="{os.path.basename(name)}"'
+    return response
+
+# Example:
+# curl "http://localhost:8000/archives/3f/a2/<token>_logs.zip/entries/?prefix=2026/"
+# curl "http://localhost:8000/archives/3f/a2/<token>_logs.zip/entry/?name=2026/app.log" -o app.log
+```
+
+These two endpoints let a client work with one file inside a large archive instead of downloading all of it through `download_file`. `list_archive` returns entry names, sizes and timestamps. It opens the archive with `zipfile`, which seeks to the end-of-central-directory record and reads only the directory. The parsed directory is cached in an LRU keyed by path, modification time and size, so later requests touch no archive bytes until the file changes. `extract_entry` takes the entry's local header offset from the cached directory, seeks straight to it and skips the header. It then streams the entry through `zipfile`'s own decompressing reader, which also checks the CRC. Only that entry's bytes are read from disk. Encrypted entries, directories and unknown names are rejected. Paths are resolved inside `compressed/`, so requests cannot escape the media directory.
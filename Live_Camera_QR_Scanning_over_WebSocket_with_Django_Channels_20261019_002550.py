@@ -0,0 +1,224 @@
+Title: Live Camera QR Scanning over WebSocket with Django Channels
+
+```python
+# settings.py
+# pip install "channels[daphne]" opencv-python-headless numpy
+
+INSTALLED_APPS = [
+    'daphne',  # must come before django.contrib.staticfiles so runserver serves ASGI
+    # ...
+    'qr_code_app',
+]
+
+ASGI_APPLICATION = 'qr_project.asgi.application'
+
+QR_SCAN_MAX_DIMENSION = 1280
+QR_LIVE_WORKERS = 4
+QR_LIVE_MAX_FRAME_BYTES = 512 * 1024
+# Camera frames are already small; this keeps detection fast on large ones
+QR_LIVE_MAX_DIMENSION = 960
+# A code is reported again once it has been out of view for this many
+# scanned frames, or once this many seconds have passed since it was sent
+QR_LIVE_CLEAR_AFTER_MISSES = 5
+QR_LIVE_REPEAT_AFTER_SECONDS = 3.0
+
+# qr_project/asgi.py
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'qr_project.settings')
+# Set up Django before importing consumers, which import models and settings
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter
+from channels.security.websocket import AllowedHostsOriginValidator
+from qr_code_app.routing import websocket_urlpatterns
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': AllowedHostsOriginValidator(URLRouter(websocket_urlpatterns)),
+})
+
+# qr_code_app/routing.py
+from django.urls import path
+from . import consumers
+
+websocket_urlpatterns = [
+    path('ws/scan/', consumers.LiveScanConsumer.as_asgi()),
+]
+
+# qr_code_app/consumers.py
+# Continuous scanning of camera frames sent over a WebSocket
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+from django.conf import settings
+
+from .scanning import decode_grayscale, scan_image
+
+logger = logging.getLogger(__name__)
+
+# Shared by all connections; each thread reuses its own detector
+_executor = ThreadPoolExecutor(max_workers=settings.QR_LIVE_WORKERS, thread_name_prefix='qr-live')
+
+def scan_frame(encoded: bytes):
+    image = decode_grayscale(encoded)
+    if image is None:
+        return None
+    return scan_image(image, settings.QR_LIVE_MAX_DIMENSION).data
+
+class LiveScanConsumer(AsyncWebsocketConsumer):
+    """
+    Receive binary camera frames (JPEG or WebP) and push back decoded codes.
+
+    Only the newest frame matters for live scanning, so each connection
+    keeps a single slot: a frame that arrives while another is waiting
+    replaces it, and at most one frame per connection is being scanned at a
+    time. Under load, stale frames are dropped instead of queueing up and
+    adding latency.
+    """
+
+    async def connect(self):
+        self.latest = None          # (sequence, received at, bytes) waiting to be scanned
+        self.sequence = 0
+        self.dropped = 0
+        self.last_sent = None
+        self.last_sent_at = 0.0
+        self.misses = 0
+        self.frame_ready = asyncio.Event()
+        await self.accept()
+        self.scanner = asyncio.create_task(self.scan_loop())
+
+    async def disconnect(self, code):
+        scanner = getattr(self, 'scanner', None)
+        if scanner is not None:
+            scanner.cancel()
+
+    async def receive(self, text_data=None, bytes_data=None):
+        if bytes_data is None:
+            return
+        if len(bytes_data) > settings.QR_LIVE_MAX_FRAME_BYTES:
+            await self.close(code=1009)  # message too big
+            return
+        self.sequence += 1
+        if self.latest is not None:
+            self.dropped += 1
+        self.latest = (self.sequence, time.perf_counter(), bytes_data)
+        self.frame_ready.set()
+
+    async def scan_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.frame_ready.wait()
+            self.frame_ready.clear()
+            sequence, received, frame = self.latest
+            self.latest = None
+            try:
+                data = await loop.run_in_executor(_executor, scan_frame, frame)
+            except Exception:
+                logger.exception('Live scan of frame %s failed', sequence)
+                data = None
+            now = time.perf_counter()
+            if data is None:
+                # Once the code has left view, showing it again counts as a new scan
+                self.misses += 1
+                if self.misses >= settings.QR_LIVE_CLEAR_AFTER_MISSES:
+                    self.last_sent = None
+                continue
+            self.misses = 0
+            # Repeating the same code for every frame it stays in view adds nothing
+            if data == self.last_sent and now - self.last_sent_at < settings.QR_LIVE_REPEAT_AFTER_SECONDS:
+                continue
+            self.last_sent, self.last_sent_at = data, now
+            try:
+                await self.send(text_data=json.dumps({
+                    'data': data,
+                    'frame': sequence,
+                    'latency_ms': round((now - received) * 1000, 1),
+                    'dropped_frames': self.dropped,
+                }))
+            except Exception:
+                # The socket is gone or broken; without this the task would end silently
+                logger.exception('Sending live scan result failed; closing the connection')
+                try:
+                    await self.close(code=1011)  # internal error
+                except Exception:
+                    pass
+                return
+
+# qr_code_app/views.py (addition)
+from django.shortcuts import render
+
+def live_scan(request):
+    return render(request, 'qr_code_app/live_scan.html')
+
+# qr_code_app/urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.generate_qr_code, name='generate_qr_code'),
+    path('list/', views.qr_list, name='qr_list'),
+    path('scan/', views.scan_qr_code, name='scan_qr_code'),
+    path('scan/bulk/', views.scan_qr_bulk, name='scan_qr_bulk'),
+    path('scan/live/', views.live_scan, name='live_scan'),
+]
+
+# qr_code_app/templates/qr_code_app/live_scan.html
+"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Live QR Scan</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body { font-family: Arial, sans-serif; text-align: center; margin: 0; padding: 10px; }
+        video { width: 100%; max-width: 480px; }
+    </style>
+</head>
+<body>
+    <h1>Live QR Scan</h1>
+    <video id="camera" autoplay playsinline muted></video>
+    <p id="result">Point the camera at a QR code</p>
+    <canvas id="frame" hidden></canvas>
+    <script>
+        const video = document.getElementById('camera');
+        const canvas = document.getElementById('frame');
+        const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+        const socket = new WebSocket(`${scheme}://${location.host}/ws/scan/`);
+        socket.binaryType = 'arraybuffer';
+        socket.onmessage = (event) => {
+            const result = JSON.parse(event.data);
+            document.getElementById('result').textContent = `${result.data} (${result.latency_ms} ms)`;
+        };
+
+        function sendFrame() {
+            // Skip this tick while the previous frame is still being sent
+            if (socket.readyState === WebSocket.OPEN && socket.bufferedAmount === 0 && video.videoWidth) {
+                const scale = Math.min(1, 960 / Math.max(video.videoWidth, video.videoHeight));
+                canvas.width = video.videoWidth * scale;
+                canvas.height = video.videoHeight * scale;
+                canvas.getContext('2d').drawImage(video, 0, 0, canvas.width, canvas.height);
+                canvas.toBlob((blob) => blob && socket.send(blob), 'image/jpeg', 0.7);
+            }
+            setTimeout(sendFrame, 100);
+        }
+
+        navigator.mediaDevices.getUserMedia({ video: { facingMode: 'environment' } })
+            .then((stream) => { video.srcObject = stream; sendFrame(); })
+            .catch(() => { document.getElementById('result').textContent = 'Camera unavailable'; });
+    </script>
+</body>
+</html>
+"""
+
+# Run with: daphne qr_project.asgi:application  (or python manage.py runserver with daphne installed)
+```
+
+This adds continuous scanning from a phone camera, replacing the upload-then-POST flow. The live page captures about ten frames a second, shrinks them to at most 960 pixels and sends them as JPEG over a WebSocket. `LiveScanConsumer` receives the frames under Django Channels. Decoding and detection run on a shared thread pool using the grayscale pipeline from `scanning.py`, so the event loop is never blocked. Each connection keeps only one waiting frame, and a newer frame replaces it. At most one frame per connection is scanned at a time, so stale frames are dropped under load instead of piling up behind the detector. A decoded payload is pushed to the client as soon as it is read, together with the end-to-end latency and the number of dropped frames. The same code is not sent again while it stays in view. It is reported again after `QR_LIVE_CLEAR_AFTER_MISSES` scanned frames without a code, or after `QR_LIVE_REPEAT_AFTER_SECONDS`, so scanning a code twice in a row still works. If sending a result fails, the error is logged and the connection is closed instead of the scan task ending silently. The browser also skips sending while the previous frame is still in the socket buffer, which keeps slow connections from queueing frames.
@@ -0,0 +1,238 @@
+Title: Merging PDF Files in Django with Shared Resource Deduplication
+
+```python
+# Install necessary package
+# pip install PyPDF2
+
+# pdf_dedupe.py
+import hashlib
+from typing import Dict, Tuple
+
+from PyPDF2.generic import (
+    ArrayObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    StreamObject,
+)
+
+class ResourceDeduplicator:
+    """
+    Collapse identical resource objects (fonts, font files, images, forms)
+    shared by pages from different input PDFs.
+
+    Every indirect object reachable from a page's /Resources is hashed by its
+    content. The first object seen for a given hash becomes the canonical
+    copy and later references to an identical object are rewritten to point
+    at it, so PdfWriter only copies it into the output once.
+    """
+
+    def __init__(self):
+        self._by_digest: Dict[str, IndirectObject] = {}
+        self._resolved: Dict[Tuple[int, int, int], IndirectObject] = {}
+        self.duplicates = 0
+        self.stream_bytes_saved = 0
+
+    def dedupe_page(self, page) -> None:
+        """Rewrite the resources of a page to use canonical shared objects."""
+        if '/Resources' not in page:
+            return
+        resources = page.raw_get('/Resources')
+        page[NameObject('/Resources')] = self._dedupe(resources)
+
+    def _dedupe(self, obj):
+        if isinstance(obj, IndirectObject):
+            key = (id(obj.pdf), obj.idnum, obj.generation)
+            if key in self._resolved:
+                return self._resolved[key]
+            # Guard against reference cycles while the children are visited
+            self._resolved[key] = obj
+
+            target = obj.get_object()
+            self._dedupe_children(target)
+            digest = self._digest(target)
+            canonical = self._by_digest.setdefault(digest, obj)
+            if canonical is not obj:
+                self.duplicates += 1
+                if isinstance(target, StreamObject):
+                    self.stream_bytes_saved += len(target._data)
+            self._resolved[key] = canonical
+            return canonical
+
+        self._dedupe_children(obj)
+        return obj
+
+    def _dedupe_children(self, obj) -> None:
+        if isinstance(obj, DictionaryObject):
+            for name in list(obj.keys()):
+                obj[NameObject(name)] = self._dedupe(obj.raw_get(name))
+        elif isinstance(obj, ArrayObject):
+            for index, item in enumerate(obj):
+                obj[index] = self._dedupe(item)
+
+    def _digest(self, obj) -> str:
+        hasher = hashlib.sha256()
+        self._feed(hasher, obj)
+        return hasher.hexdigest()
+
+    def _feed(self, hasher, obj) -> None:
+        if isinstance(obj, IndirectObject):
+            # Children have already been canonicalized, so identical
+            # subtrees point at the same object by now
+            hasher.update(f'R{id(obj.pdf)}:{obj.idnum}:{obj.generation};'.encode())
+        elif isinstance(obj, DictionaryObject):
+            hasher.update(b'<<')
+            for name in sorted(obj.keys()):
+                if isinstance(obj, StreamObject) and name == '/Length':
+                    continue
+                hasher.update(name.encode('latin-1'))
+                self._feed(hasher, obj.raw_get(name))
+            hasher.update(b'>>')
+            if isinstance(obj, StreamObject):
+                hasher.update(b'stream')
+                hasher.update(obj._data)
+        elif isinstance(obj, ArrayObject):
+            hasher.update(b'[')
+            for item in obj:
+                self._feed(hasher, item)
+            hasher.update(b']')
+        else:
+            hasher.update(f'{type(obj).__name__}:{obj!r};'.encode())
+
+# pdf_utils.py
+import os
+import time
+from PyPDF2 import PdfReader, PdfWriter
+from .pdf_dedupe import ResourceDeduplicator
+
+def merge_pdfs(pdf_files, output_dir, dedupe_resources=False):
+    """
+    Merge multiple PDF files into a single PDF file.
+
+    Parameters:
+    pdf_files (list): List of PDF files to be merged.
+    output_dir (str): Directory where the merged PDF will be saved.
+    dedupe_resources (bool): Write fonts, images and other resources that
+        are identical across inputs only once.
+
+    Returns:
+    str: Path to the merged PDF file.
+    """
+    pdf_writer = PdfWriter()
+    deduplicator = ResourceDeduplicator() if dedupe_resources else None
+
+    # Keep every reader alive until the output is written, since deduplicated
+    # pages may reference objects owned by an earlier reader
+    readers = []
+    for pdf_file in pdf_files:
+        pdf_reader = PdfReader(pdf_file)
+        readers.append(pdf_reader)
+
+        for page in pdf_reader.pages:
+            if deduplicator is not None:
+                deduplicator.dedupe_page(page)
+            pdf_writer.add_page(page)
+
+    # Define output file path
+    output_path = os.path.join(output_dir, 'merged_document.pdf')
+
+    # Write the PDF content to a file
+    with open(output_path, 'wb') as output_pdf:
+        pdf_writer.write(output_pdf)
+
+    return output_path
+
+def compare_merge_modes(pdf_paths, output_dir):
+    """
+    Merge the same inputs with and without resource deduplication.
+
+    Returns a dict with the output size and merge time of each mode and the
+    number of bytes the deduplicated output saves.
+    """
+    results = {}
+    for mode, dedupe in (('default', False), ('dedupe', True)):
+        mode_dir = os.path.join(output_dir, mode)
+        os.makedirs(mode_dir, exist_ok=True)
+        started = time.perf_counter()
+        output_path = merge_pdfs(pdf_paths, mode_dir, dedupe_resources=dedupe)
+        results[mode] = {
+            'seconds': round(time.perf_counter() - started, 4),
+            'bytes': os.path.getsize(output_path),
+        }
+    results['bytes_saved'] = results['default']['bytes'] - results['dedupe']['bytes']
+    return results
+
+# views.py
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.conf import settings
+from .pdf_utils import merge_pdfs
+
+def merge_pdf_view(request):
+    """
+    Handle the PDF merging request and return the merged PDF response.
+
+    Send `dedupe=1` with the upload to write shared resources only once.
+    """
+    if request.method == 'POST' and request.FILES.getlist('pdf_files'):
+        pdf_files = request.FILES.getlist('pdf_files')
+        dedupe = request.POST.get('dedupe') in ('1', 'true', 'on')
+
+        merged_pdf_path = merge_pdfs(pdf_files, settings.MEDIA_ROOT, dedupe_resources=dedupe)
+
+        with open(merged_pdf_path, 'rb') as pdf_file:
+            response = HttpResponse(pdf_file.read(), content_type='application/pdf')
+            response['Content-Disposition'] = 'attachment; filename="merged_document.pdf"'
+            return response
+
+    return render(request, 'merge_pdf.html')
+
+# management/commands/compare_pdf_dedupe.py
+import json
+import tempfile
+from django.core.management.base import BaseCommand
+from ...pdf_utils import compare_merge_modes
+
+class Command(BaseCommand):
+    help = 'Compare merged output size and merge time with and without resource deduplication'
+
+    def add_arguments(self, parser):
+        parser.add_argument('pdf_paths', nargs='+', help='PDF files to merge, in order')
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as output_dir:
+            results = compare_merge_modes(options['pdf_paths'], output_dir)
+        self.stdout.write(json.dumps(results, indent=2))
+
+# merge_pdf.html
+'''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Merge PDF Files</title>
+</head>
+<body>
+    <h1>Merge PDF Files</h1>
+    <form method="post" enctype="multipart/form-data">
+        {% csrf_token %}
+        <label for="pdf_files">Select PDF files to merge:</label>
+        <input type="file" id="pdf_files" name="pdf_files" multiple required>
+        <label><input type="checkbox" name="dedupe" value="1" checked> Share identical fonts and images</label>
+        <button type="submit">Merge PDFs</button>
+    </form>
+</body>
+</html>
+'''
+
+# Example:
+# python manage.py compare_pdf_dedupe statements/*.pdf
+# {
+#   "default": {"seconds": <float>, "bytes": <int>},
+#   "dedupe": {"seconds": <float>, "bytes": <int>},
+#   "bytes_saved": <int>
+# }
+```
+
+This variant of the modular PDF merger adds a deduplication mode for documents that come from the same generator. Before each page is handed to `PdfWriter.add_page`, the `ResourceDeduplicator` walks its `/Resources` tree and hashes every indirect object by content. Identical fonts, embedded font files and logo images are rewritten to reference the first copy seen, so the writer copies them into the output only once. The `compare_pdf_dedupe` management command merges the same inputs in both modes and reports the output sizes, the merge times and the bytes saved.
@@ -0,0 +1,291 @@
+Title: Multi-Code Bulk QR Scanning with NDJSON Streaming in Django
+
+```python
+# settings.py
+# pip install pillow qrcode opencv-python-headless numpy
+
+INSTALLED_APPS = [
+    # ...
+    'qr_code_app',
+]
+
+QR_SCAN_MAX_DIMENSION = 1280
+# Labels in a shelf photo are small, so multi-code scans keep more resolution
+QR_SCAN_MULTI_MAX_DIMENSION = 2560
+QR_BULK_WORKERS = 4
+QR_BULK_MAX_IMAGES = 2000
+QR_BULK_MAX_IMAGE_BYTES = 25 * 1024 * 1024
+
+# qr_code_app/urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.generate_qr_code, name='generate_qr_code'),
+    path('list/', views.qr_list, name='qr_list'),
+    path('scan/', views.scan_qr_code, name='scan_qr_code'),
+    path('scan/bulk/', views.scan_qr_bulk, name='scan_qr_bulk'),
+]
+
+# qr_code_app/scanning.py (additions)
+# Every code in an image, not just the first
+
+from typing import List
+
+class DecodedCode(NamedTuple):
+    data: str
+    points: List[List[float]]  # corners in original image coordinates
+
+def _detect_all(image, scale: float) -> List[DecodedCode]:
+    found, decoded, points, _ = get_detector().detectAndDecodeMulti(image)
+    if not found or points is None:
+        return []
+    return [
+        DecodedCode(data, (corners / scale).round(1).tolist())
+        for data, corners in zip(decoded, points)
+        if data  # located but undecodable codes come back as empty strings
+    ]
+
+def scan_image_multi(image: np.ndarray, max_dimension: Optional[int] = None) -> List[DecodedCode]:
+    """
+    Detect and decode every QR code in a grayscale image.
+
+    Large images are scanned downscaled and at full size. The reduced pass
+    reads codes that are blurred or oversized at full resolution, while the
+    smallest labels only survive at full size, so a shelf photo needs both.
+    Results are merged by payload; each code keeps the corners from the
+    pass that found it first.
+    """
+    max_dimension = max_dimension or settings.QR_SCAN_MULTI_MAX_DIMENSION
+    height, width = image.shape[:2]
+    scale = min(1.0, max_dimension / max(height, width))
+    codes = {}
+    if scale < 1.0:
+        small = cv2.resize(image, (round(width * scale), round(height * scale)),
+                           interpolation=cv2.INTER_AREA)
+        for code in _detect_all(small, scale):
+            codes.setdefault(code.data, code)
+    for code in _detect_all(image, 1.0):
+        codes.setdefault(code.data, code)
+    return list(codes.values())
+
+# qr_code_app/bulk_scan.py
+# Scan many images concurrently and report each one as soon as it is done
+
+import json
+import os
+import time
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+from django.conf import settings
+
+from .scanning import decode_grayscale, scan_image_multi
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.webp', '.tif', '.tiff'}
+# Raised by zipfile for corrupt archives, CRC mismatches, unsupported
+# compression methods and encrypted members
+ARCHIVE_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError, OSError, NotImplementedError, RuntimeError)
+
+# OpenCV releases the GIL while decoding and detecting, so threads scale
+# across cores; each thread keeps its own detector (see get_detector)
+_executor = ThreadPoolExecutor(max_workers=settings.QR_BULK_WORKERS, thread_name_prefix='qr-scan')
+
+class ImageLimitReached(Exception):
+    """More than QR_BULK_MAX_IMAGES images were uploaded."""
+
+def iter_images(uploads):
+    """
+    Yield (source name, encoded bytes, error) for uploaded images and ZIP members.
+
+    ZIP members are read one at a time when requested, so a large archive is
+    never expanded in memory all at once. Unreadable archives and members
+    are yielded with an error instead of bytes. ImageLimitReached is raised
+    when the next image would exceed QR_BULK_MAX_IMAGES.
+    """
+    count = 0
+
+    def count_image():
+        nonlocal count
+        count += 1
+        if count > settings.QR_BULK_MAX_IMAGES:
+            raise ImageLimitReached()
+
+    for upload in uploads:
+        upload.seek(0)
+        if not zipfile.is_zipfile(upload):
+            count_image()
+            upload.seek(0)
+            if upload.size > settings.QR_BULK_MAX_IMAGE_BYTES:
+                yield upload.name, None, 'image too large'
+                continue
+            yield upload.name, upload.read(), None
+            continue
+
+        upload.seek(0)
+        try:
+            archive = zipfile.ZipFile(upload)
+        except ARCHIVE_ERRORS as e:
+            yield upload.name, None, f'not a readable ZIP archive: {e}'
+            continue
+        with archive:
+            for info in archive.infolist():
+                if info.is_dir() or os.path.splitext(info.filename)[1].lower() not in IMAGE_EXTENSIONS:
+                    continue
+                count_image()
+                source = f'{upload.name}/{info.filename}'
+                if info.file_size > settings.QR_BULK_MAX_IMAGE_BYTES:
+                    yield source, None, 'image too large'
+                    continue
+                try:
+                    encoded = archive.read(info)
+                except ARCHIVE_ERRORS as e:
+                    yield source, None, f'unreadable archive member: {e}'
+                    continue
+                yield source, encoded, None
+
+def _scan_one(source, encoded, error):
+    started = time.perf_counter()
+    if error is not None:
+        return {'source': source, 'error': error}
+    image = decode_grayscale(encoded)
+    if image is None:
+        return {'source': source, 'error': 'not a readable image'}
+    codes = scan_image_multi(image)
+    return {
+        'source': source,
+        'codes': [code._asdict() for code in codes],
+        'seconds': round(time.perf_counter() - started, 4),
+    }
+
+def stream_scan_results(uploads):
+    """
+    Yield one NDJSON line per image, in completion order, then a summary line.
+
+    At most twice as many images as there are workers are in flight, which
+    bounds memory however many images the upload holds. A failure in one
+    image becomes that image's error line and never ends the stream early;
+    the summary says whether images were left out because of the limit.
+    """
+    started = time.perf_counter()
+    pending = {}  # future -> source
+    images = codes = 0
+    truncated = False
+    window = settings.QR_BULK_WORKERS * 2
+
+    def finished(future):
+        nonlocal images, codes
+        source = pending.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {'source': source, 'error': f'scan failed: {e}'}
+        images += 1
+        codes += len(result.get('codes', ()))
+        return json.dumps(result) + '\n'
+
+    try:
+        for source, encoded, error in iter_images(uploads):
+            pending[_executor.submit(_scan_one, source, encoded, error)] = source
+            # Collect whatever is done; block only when the window is full
+            done, _ = wait(pending, timeout=None if len(pending) >= window else 0,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                yield finished(future)
+    except ImageLimitReached:
+        truncated = True
+        yield json.dumps({
+            'error': f'Only the first {settings.QR_BULK_MAX_IMAGES} images were scanned',
+        }) + '\n'
+    for future in as_completed(list(pending)):
+        yield finished(future)
+
+    elapsed = time.perf_counter() - started
+    yield json.dumps({
+        'summary': True,
+        'images': images,
+        'codes': codes,
+        'truncated': truncated,
+        'seconds': round(elapsed, 3),
+        'images_per_second': round(images / elapsed, 1) if elapsed else None,
+    }) + '\n'
+
+# qr_code_app/views.py (addition)
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_POST
+from .bulk_scan import stream_scan_results
+
+@require_POST
+def scan_qr_bulk(request):
+    """
+    Scan every code in every uploaded image.
+
+    Upload any number of images and/or ZIP archives of images in the
+    `qr_image` field. Each line of the response is the JSON result for one
+    image, written as soon as that image is done; the last line is a summary.
+    """
+    uploads = request.FILES.getlist('qr_image')
+    if not uploads:
+        return JsonResponse({'error': 'Upload images or ZIP archives as qr_image'}, status=400)
+    response = StreamingHttpResponse(stream_scan_results(uploads), content_type='application/x-ndjson')
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+# qr_code_app/templates/qr_code_app/scan.html
+"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Scan QR Code</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body>
+    <h1>Scan QR Code</h1>
+    <form method="post" enctype="multipart/form-data">
+        {% csrf_token %}
+        <input type="file" name="qr_image" accept="image/*" required><br>
+        <button type="submit">Scan</button>
+    </form>
+
+    <h2>Bulk Scan</h2>
+    <form id="bulk" method="post" action="{% url 'scan_qr_bulk' %}" enctype="multipart/form-data">
+        {% csrf_token %}
+        <input type="file" name="qr_image" accept="image/*,.zip" multiple required><br>
+        <button type="submit">Scan All</button>
+    </form>
+    <ul id="results"></ul>
+    <script>
+        document.getElementById('bulk').addEventListener('submit', async (e) => {
+            e.preventDefault();
+            const list = document.getElementById('results');
+            list.innerHTML = '';
+            const response = await fetch(e.target.action, { method: 'POST', body: new FormData(e.target) });
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffered = '';
+            for (;;) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffered += value;
+                const lines = buffered.split('\n');
+                buffered = lines.pop();
+                for (const line of lines) {
+                    const result = JSON.parse(line);
+                    const item = document.createElement('li');
+                    item.textContent = result.summary
+                        ? `${result.images} images, ${result.codes} codes in ${result.seconds} s${result.truncated ? ' (truncated)' : ''}`
+                        : `${result.source || 'upload'}: ${result.error || result.codes.map(c => c.data).join(', ') || 'no codes'}`;
+                    list.appendChild(item);
+                }
+            }
+        });
+    </script>
+</body>
+</html>
+"""
+
+# Example:
+# curl -F qr_image=@shelf-a.jpg -F qr_image=@aisle-3.zip http://localhost:8000/scan/bulk/
+```
+
+This adds a bulk scan mode next to `scan_qr_code`, which only reads the first code in a single image. `scan_image_multi` uses OpenCV's `detectAndDecodeMulti` to decode every code in an image. It returns each payload with its corner points mapped back to the original image's coordinates. Large photos are scanned both downscaled, to a larger limit than the single-code path uses, and at full size. The results are merged by payload, so a label found only in one pass is still reported, and a label found in both is reported once. `scan_qr_bulk` accepts any mix of images and ZIP archives of images in one upload. ZIP members are read one at a time. The images are scanned on a thread pool. OpenCV releases the GIL while it works and each thread reuses its own detector, so the scans run in parallel. At most twice as many images as workers are in flight, which bounds memory for archives of any size. Each image's result is written as one NDJSON line as soon as it is ready, and a summary line with throughput comes last. A corrupt archive, an unreadable member or a failed scan becomes an error line for that source, and the stream carries on. If the upload holds more than `QR_BULK_MAX_IMAGES` images, an error line says so and the summary is marked `truncated`. The scan page shows results as they stream in.
@@ -0,0 +1,160 @@
+Title: Multi-Core Parallel Gzip Compression for Large Uploads in Django
+
+```python
+# settings.py
+# Parallel compression settings for the file compression tool
+
+PARALLEL_COMPRESSION_WORKERS = None        # None uses every core
+PARALLEL_COMPRESSION_BLOCK_SIZE = 4 * 1024 * 1024
+PARALLEL_COMPRESSION_THRESHOLD = 64 * 1024 * 1024  # smaller files use one core
+
+# parallel_gzip.py in myapp
+# pigz-style compression: independent gzip members compressed on a pool and
+# written in order. Any gzip reader decompresses the concatenated members.
+
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import BinaryIO, Optional
+
+def _compress_block(args):
+    block, level = args
+    # mtime=0 keeps the output reproducible for identical input
+    return gzip.compress(block, compresslevel=level, mtime=0)
+
+def parallel_gzip(source: BinaryIO, destination: BinaryIO, level: int = 6,
+                  workers: Optional[int] = None, block_size: int = 4 * 1024 * 1024,
+                  use_processes: bool = False) -> int:
+    """
+    Compress `source` into `destination` as concatenated gzip members.
+
+    Blocks are compressed concurrently. zlib releases the GIL while it
+    works, so threads scale across cores without pickling the blocks;
+    `use_processes` is there for interpreters where that does not hold. At
+    most two blocks per worker are in flight, so memory use is bounded by
+    the block size rather than the file size. Returns the input byte count.
+    """
+    workers = workers or os.cpu_count() or 1
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    pending = deque()
+    total = 0
+    with executor_class(max_workers=workers) as pool:
+        while True:
+            block = source.read(block_size)
+            if not block:
+                break
+            total += len(block)
+            pending.append(pool.submit(_compress_block, (block, level)))
+            # Write finished members in order once the window is full
+            while len(pending) >= workers * 2:
+                destination.write(pending.popleft().result())
+        while pending:
+            destination.write(pending.popleft().result())
+    return total
+
+def single_core_gzip(source: BinaryIO, destination: BinaryIO, level: int = 6,
+                     block_size: int = 4 * 1024 * 1024) -> int:
+    """The single-threaded baseline: one gzip stream over the whole input."""
+    total = 0
+    with gzip.GzipFile(fileobj=destination, mode='wb', compresslevel=level, mtime=0) as gz:
+        while True:
+            block = source.read(block_size)
+            if not block:
+                break
+            gz.write(block)
+            total += len(block)
+    return total
+
+# views.py in myapp
+import os
+import zipfile
+from django.conf import settings
+from .parallel_gzip import parallel_gzip
+
+def compress_file(uploaded_file):
+    """
+    Compress an upload, switching to parallel gzip for large files.
+
+    Small files keep the single ZIP entry produced so far. Large files are
+    written as `.gz`, compressed on every core.
+    """
+    source_path = uploaded_file.original_file.path
+    base_name = os.path.basename(uploaded_file.original_file.name)
+
+    if os.path.getsize(source_path) >= settings.PARALLEL_COMPRESSION_THRESHOLD:
+        compressed_name = f'compressed/{base_name}.gz'
+        compressed_path = os.path.join(settings.MEDIA_ROOT, compressed_name)
+        with open(source_path, 'rb') as source, open(compressed_path, 'wb') as destination:
+            parallel_gzip(
+                source,
+                destination,
+                workers=settings.PARALLEL_COMPRESSION_WORKERS,
+                block_size=settings.PARALLEL_COMPRESSION_BLOCK_SIZE,
+            )
+    else:
+        compressed_name = f'compressed/{base_name}.zip'
+        compressed_path = os.path.join(settings.MEDIA_ROOT, compressed_name)
+        with zipfile.ZipFile(compressed_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.write(source_path, arcname=base_name)
+
+    # Update the compressed file field in the database
+    uploaded_file.compressed_file.name = compressed_name
+    uploaded_file.save()
+
+# management/commands/benchmark_parallel_gzip.py in myapp
+import io
+import os
+import time
+from django.core.management.base import BaseCommand
+from ...parallel_gzip import parallel_gzip, single_core_gzip
+
+class Command(BaseCommand):
+    help = 'Measure parallel gzip throughput against the single-core baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to compress, ideally several hundred MB')
+        parser.add_argument('--level', type=int, default=6)
+        parser.add_argument('--block-size', type=int, default=4 * 1024 * 1024)
+        parser.add_argument('--processes', action='store_true', help='Use a process pool instead of threads')
+
+    def handle(self, *args, **options):
+        cores = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cores:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cores:
+            worker_counts.append(cores)
+
+        def measure(compress):
+            # Compress into a counting sink so disk speed does not skew the numbers
+            sink = _CountingSink()
+            with open(options['path'], 'rb') as source:
+                started = time.perf_counter()
+                size = compress(source, sink)
+                seconds = time.perf_counter() - started
+            return size / 1e6 / seconds, sink.count
+
+        baseline, baseline_out = measure(lambda src, dst: single_core_gzip(src, dst, options['level']))
+        self.stdout.write(f'single-core gzip   {baseline:8.1f} MB/s  output {baseline_out / 1e6:.1f} MB')
+        for workers in worker_counts:
+            rate, out = measure(lambda src, dst: parallel_gzip(
+                src, dst, options['level'], workers, options['block_size'], options['processes']))
+            self.stdout.write(
+                f'parallel x{workers:<3}       {rate:8.1f} MB/s  output {out / 1e6:.1f} MB  '
+                f'scaling x{rate / baseline:.2f}'
+            )
+
+class _CountingSink(io.RawIOBase):
+    def __init__(self):
+        self.count = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.count += len(data)
+        return len(data)
+```
+
+This addition gives the file compression tool a multi-core path for very large uploads. `parallel_gzip` cuts the input into fixed-size blocks and compresses each block on a pool as an independent gzip member, then writes the members in their original order. Concatenated gzip members are part of the gzip format, so `gzip -d`, `zcat` and Python's `gzip` module all decompress the result as one file. zlib releases the GIL while it compresses, so a thread pool scales across cores without copying blocks between processes. Only two blocks per worker are held in memory at any time. Files below `PARALLEL_COMPRESSION_THRESHOLD` still get the single ZIP entry. The `benchmark_parallel_gzip` command reports throughput and output size at 1, 2, 4 and more workers, up to the core count, against the single-core baseline.
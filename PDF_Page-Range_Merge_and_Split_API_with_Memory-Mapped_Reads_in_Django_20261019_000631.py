@@ -0,0 +1,204 @@
+Title: PDF Page-Range Merge and Split API with Memory-Mapped Reads in Django
+
+```python
+# Install necessary package
+# pip install PyPDF2
+
+# page_ranges.py
+from typing import List
+
+class PageRangeError(ValueError):
+    """Raised when a page range specification cannot be used."""
+
+def parse_page_ranges(spec: str, page_count: int) -> List[int]:
+    """
+    Turn a 1-based range specification into 0-based page indexes.
+
+    Accepts comma-separated pages and ranges such as "1-3,7,10-". An open
+    end runs to the last page, and an empty spec selects every page. Pages
+    are returned in the order given, so "5,1-2" is allowed.
+    """
+    spec = (spec or '').strip()
+    if not spec:
+        return list(range(page_count))
+
+    indexes = []
+    for part in spec.split(','):
+        part = part.strip()
+        try:
+            if '-' in part:
+                start_text, end_text = part.split('-', 1)
+                start = int(start_text) if start_text.strip() else 1
+                end = int(end_text) if end_text.strip() else page_count
+            else:
+                start = end = int(part)
+        except ValueError:
+            raise PageRangeError(f'Invalid page range "{part}".')
+        if start < 1 or end > page_count or start > end:
+            raise PageRangeError(f'Page range "{part}" is outside 1-{page_count}.')
+        indexes.extend(range(start - 1, end))
+    return indexes
+
+# pdf_utils.py
+import io
+import mmap
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, List, Sequence, Tuple
+from PyPDF2 import PdfReader, PdfWriter
+from .page_ranges import parse_page_ranges
+
+@contextmanager
+def mapped_pdf(path: str) -> Iterator[PdfReader]:
+    """
+    Open a PDF through a read-only memory map.
+
+    PyPDF2 resolves objects lazily, so only the cross-reference table, the
+    page tree and the objects of pages that are actually copied get read;
+    the rest of the file is never paged in.
+    """
+    with open(path, 'rb') as pdf_file:
+        with mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield PdfReader(mapped)
+
+def merge_page_ranges(sources: Sequence[Tuple[str, str]], output) -> int:
+    """
+    Merge selected pages of several PDFs into `output`.
+
+    `sources` holds (path, range spec) pairs in merge order. Returns the
+    number of pages written.
+    """
+    pdf_writer = PdfWriter()
+    # The maps must stay open until the writer has copied every object
+    with ExitStack() as stack:
+        for path, spec in sources:
+            pdf_reader = stack.enter_context(mapped_pdf(path))
+            for index in parse_page_ranges(spec, len(pdf_reader.pages)):
+                pdf_writer.add_page(pdf_reader.pages[index])
+        pdf_writer.write(output)
+    return len(pdf_writer.pages)
+
+def split_pdf(path: str, specs: List[str]) -> List[bytes]:
+    """Write one PDF per range spec, all read from a single memory map."""
+    parts = []
+    with mapped_pdf(path) as pdf_reader:
+        for spec in specs:
+            pdf_writer = PdfWriter()
+            for index in parse_page_ranges(spec, len(pdf_reader.pages)):
+                pdf_writer.add_page(pdf_reader.pages[index])
+            part = io.BytesIO()
+            pdf_writer.write(part)
+            parts.append(part.getvalue())
+    return parts
+
+# views.py
+import functools
+import io
+import zipfile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from PyPDF2.errors import PdfReadError
+from .page_ranges import PageRangeError
+from .pdf_utils import merge_page_ranges, split_pdf
+
+def spool_to_disk(view):
+    """
+    Spool the view's uploads to temporary files so they can be memory-mapped.
+
+    Only these views need uploads on disk; the rest of the project keeps
+    Django's in-memory handling of small files. Handlers can only be
+    replaced before request.FILES is read. These endpoints are APIs called
+    without a CSRF token (see the curl examples below), so they are
+    deliberately csrf_exempt, as they were before, and CsrfViewMiddleware
+    never reads the body ahead of the view.
+    """
+    @csrf_exempt
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method == 'POST':
+            request.upload_handlers = [TemporaryFileUploadHandler(request)]
+        return view(request, *args, **kwargs)
+    return wrapper
+
+@spool_to_disk
+@require_POST
+def merge_pdf_ranges(request):
+    """
+    Merge uploaded PDFs, taking only the requested pages from each.
+
+    Send one `page_ranges` value per uploaded file, in the same order, e.g.
+    "1-3" or "2,5,9-". An empty value keeps every page of that file.
+    """
+    files = request.FILES.getlist('pdf_files')
+    if not files:
+        return JsonResponse({"error": "No PDF files uploaded"}, status=400)
+    specs = request.POST.getlist('page_ranges')
+    if specs and len(specs) != len(files):
+        return JsonResponse({"error": "Send one page_ranges value per file"}, status=400)
+    specs = specs or [''] * len(files)
+
+    sources = [(f.temporary_file_path(), spec) for f, spec in zip(files, specs)]
+    response = HttpResponse(content_type='application/pdf')
+    response['Content-Disposition'] = 'attachment; filename="merged_document.pdf"'
+    try:
+        merge_page_ranges(sources, response)
+    except PageRangeError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    except (PdfReadError, ValueError):
+        # ValueError also covers empty uploads, which cannot be memory-mapped
+        return JsonResponse({"error": "Every upload must be a readable PDF"}, status=400)
+    return response
+
+@spool_to_disk
+@require_POST
+def split_pdf_view(request):
+    """
+    Split one uploaded PDF into parts, one per `ranges` value.
+
+    A single part is returned as a PDF; several parts come back as a ZIP.
+    """
+    pdf_file = request.FILES.get('pdf_file')
+    specs = request.POST.getlist('ranges')
+    if pdf_file is None or not specs:
+        return JsonResponse({"error": "Upload pdf_file and at least one ranges value"}, status=400)
+
+    try:
+        parts = split_pdf(pdf_file.temporary_file_path(), specs)
+    except PageRangeError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    except (PdfReadError, ValueError):
+        return JsonResponse({"error": "The upload must be a readable PDF"}, status=400)
+
+    if len(parts) == 1:
+        response = HttpResponse(parts[0], content_type='application/pdf')
+        response['Content-Disposition'] = 'attachment; filename="split_1.pdf"'
+        return response
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+        # PDFs are already compressed, so store the parts as-is
+        for number, part in enumerate(parts, start=1):
+            zf.writestr(f'split_{number}.pdf', part)
+    response = HttpResponse(archive.getvalue(), content_type='application/zip')
+    response['Content-Disposition'] = 'attachment; filename="split.zip"'
+    return response
+
+# urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('merge-ranges/', views.merge_pdf_ranges, name='merge_pdf_ranges'),
+    path('split/', views.split_pdf_view, name='split_pdf'),
+]
+
+# Example requests:
+# curl -F pdf_files=@report.pdf -F page_ranges=1-3 \
+#      -F pdf_files=@appendix.pdf -F page_ranges=10- \
+#      http://localhost:8000/merge-ranges/ -o merged.pdf
+# curl -F pdf_file=@book.pdf -F ranges=1-20 -F ranges=21-40 \
+#      http://localhost:8000/split/ -o parts.zip
+```
+
+These views let clients choose pages instead of always copying whole documents. The merge endpoint takes one `page_ranges` value per uploaded file, written as 1-based specs such as `1-3,7,10-`. The split endpoint turns one upload into several parts. Both views install `TemporaryFileUploadHandler` for their own requests, so their uploads are spooled to temporary files and opened through a read-only `mmap`. Other views keep Django's default in-memory handling. Uploads that are empty or not valid PDFs get a 400 instead of a server error. Because PyPDF2 resolves objects lazily, only the cross-reference table, the page tree and the objects of the selected pages are read from the map. Pulling three pages out of a 2,000-page file therefore never reads the content of the other pages.
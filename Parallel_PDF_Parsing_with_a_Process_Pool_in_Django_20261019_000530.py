@@ -0,0 +1,377 @@
+Title: Parallel PDF Parsing with a Process Pool in Django
+
+```python
+# Install necessary package
+# pip install PyPDF2
+
+# settings.py
+# Number of processes used to parse input PDFs; None uses every core
+PDF_PARSE_WORKERS = None
+
+# parallel_merge.py
+import io
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple, Union
+
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+# Object numbers 1 and 2 of the merged file are its catalog and page tree
+CATALOG_NUMBER = 1
+PAGES_NUMBER = 2
+# Stands in for a reference to the merged page tree inside serialized objects
+PAGES_REF = 0
+
+# A serialized object: literal bytes, with ints where references go. A
+# positive int is the document-local number of the referenced object.
+Parts = List[Union[bytes, int]]
+
+def _primitive(obj) -> bytes:
+    if obj is None:
+        return b'null'
+    buffer = io.BytesIO()
+    obj.write_to_stream(buffer, None)
+    return buffer.getvalue()
+
+class _DocumentSerializer:
+    """Serialize everything one document's pages reference, with local numbering."""
+
+    def __init__(self):
+        self.numbers = {}       # (idnum, generation) -> local number
+        self.objects = []       # local number - 1 -> resolved object
+        self.page_numbers = set()
+
+    def ref(self, indirect: IndirectObject) -> int:
+        key = (indirect.idnum, indirect.generation)
+        if key not in self.numbers:
+            self.objects.append(indirect.get_object())
+            self.numbers[key] = len(self.objects)
+        return self.numbers[key]
+
+    def add_page(self, page) -> int:
+        if page.indirect_reference is not None:
+            number = self.ref(page.indirect_reference)
+        else:
+            self.objects.append(None)
+            number = len(self.objects)
+        # The flattened page carries the attributes it inherited from the tree
+        self.objects[number - 1] = page
+        self.page_numbers.add(number)
+        return number
+
+    def emit(self, obj, parts: Parts, is_page: bool = False) -> None:
+        if isinstance(obj, IndirectObject):
+            parts.append(self.ref(obj))
+        elif isinstance(obj, StreamObject):
+            data = obj._data  # still encoded, so it is copied as-is
+            self._emit_dict(obj, parts, skip='/Length', extra=b'/Length %d' % len(data))
+            parts.append(b'\nstream\n' + data + b'\nendstream')
+        elif isinstance(obj, DictionaryObject):
+            self._emit_dict(obj, parts, page=is_page)
+        elif isinstance(obj, ArrayObject):
+            parts.append(b'[')
+            for item in obj:
+                self.emit(item, parts)
+                parts.append(b' ')
+            parts.append(b']')
+        else:
+            parts.append(_primitive(obj))
+
+    def _emit_dict(self, obj, parts: Parts, page=False, skip=None, extra=b'') -> None:
+        parts.append(b'<<' + extra)
+        # dict.items() gives the raw values, so references stay references
+        for key, value in dict.items(obj):
+            if key == skip:
+                continue
+            parts.append(b'\n' + _primitive(key) + b' ')
+            if page and key == '/Parent':
+                # Re-parent every page onto the merged page tree instead of
+                # pulling in the source document's tree
+                parts.append(PAGES_REF)
+            else:
+                self.emit(value, parts)
+        parts.append(b'\n>>')
+
+    def serialize(self) -> List[Parts]:
+        serialized = []
+        number = 1
+        # emit() appends newly discovered objects while this loop runs
+        while number <= len(self.objects):
+            parts: Parts = []
+            self.emit(self.objects[number - 1], parts, is_page=number in self.page_numbers)
+            serialized.append(_join_literals(parts))
+            number += 1
+        return serialized
+
+def _join_literals(parts: Parts) -> Parts:
+    joined: Parts = []
+    for part in parts:
+        if isinstance(part, bytes) and joined and isinstance(joined[-1], bytes):
+            joined[-1] += part
+        else:
+            joined.append(part)
+    return joined
+
+def serialize_pdf(args: Tuple[int, str]) -> Tuple[int, List[Parts], List[int]]:
+    """
+    Parse one input PDF in a worker process and serialize its pages.
+
+    Every object reachable from the pages is written out as PDF syntax with
+    references left as local numbers, so the parent only has to offset the
+    numbers and concatenate bytes; it never parses the input again. Returns
+    the position, the serialized objects and the local numbers of the pages.
+    """
+    position, source_path = args
+    pdf_reader = PdfReader(source_path)
+    if pdf_reader.is_encrypted:
+        raise ValueError(f'Input {position + 1} is encrypted')
+    serializer = _DocumentSerializer()
+    pages = [serializer.add_page(page) for page in pdf_reader.pages]
+    return position, serializer.serialize(), pages
+
+def write_merged(documents, output) -> int:
+    """
+    Write serialized documents to `output` as one PDF and return the page count.
+
+    Each document's local numbers are shifted past the objects already
+    written; apart from that the worker-produced bytes are copied through.
+    """
+    offsets = {}
+    kids = []
+    position = 0
+    next_number = PAGES_NUMBER + 1
+
+    def write(data: bytes):
+        nonlocal position
+        output.write(data)
+        position += len(data)
+
+    write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+    for objects, pages in documents:
+        base = next_number - 1
+        for local_number, parts in enumerate(objects, start=1):
+            number = base + local_number
+            offsets[number] = position
+            body = b''.join(
+                part if isinstance(part, bytes)
+                else b'%d 0 R' % (PAGES_NUMBER if part == PAGES_REF else base + part)
+                for part in parts
+            )
+            write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+        kids.extend(base + local_number for local_number in pages)
+        next_number += len(objects)
+
+    offsets[PAGES_NUMBER] = position
+    write(b'%d 0 obj\n<< /Type /Pages /Count %d /Kids [%s] >>\nendobj\n' % (
+        PAGES_NUMBER, len(kids), b' '.join(b'%d 0 R' % kid for kid in kids)))
+    offsets[CATALOG_NUMBER] = position
+    write(b'%d 0 obj\n<< /Type /Catalog /Pages %d 0 R >>\nendobj\n' % (CATALOG_NUMBER, PAGES_NUMBER))
+
+    xref_position = position
+    write(b'xref\n0 %d\n0000000000 65535 f \n' % next_number)
+    write(b''.join(b'%010d 00000 n \n' % offsets[number] for number in range(1, next_number)))
+    write(b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        next_number, CATALOG_NUMBER, xref_position))
+    return len(kids)
+
+class ParallelMergeEngine:
+    """
+    Merge PDFs by parsing and serializing every input concurrently.
+
+    The workers do all of the parsing. The parent's serial share is a single
+    pass that renumbers references and writes bytes, so it shrinks as
+    workers are added instead of repeating the sequential merge. The pool is
+    created on first use and kept for later merges.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def _discard_pool(self, pool) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def merge(self, source_paths: List[str], output_path: str) -> int:
+        """Merge the files at `source_paths` into `output_path` and return the page count."""
+        tasks = list(enumerate(source_paths))
+        for attempt in range(2):
+            pool = self._get_pool()
+            try:
+                # map() yields results in submission order, which is the merge order
+                documents = [(objects, pages) for _, objects, pages in pool.map(serialize_pdf, tasks)]
+                break
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool once
+                self._discard_pool(pool)
+                if attempt:
+                    raise
+        with open(output_path, 'wb') as output_pdf:
+            return write_merged(documents, output_pdf)
+
+def merge_pdfs_sequential(source_paths: List[str], output_path: str) -> int:
+    """The existing single-core merge, kept as the benchmark baseline."""
+    pdf_writer = PdfWriter()
+    for path in source_paths:
+        pdf_reader = PdfReader(path)
+        for page in pdf_reader.pages:
+            pdf_writer.add_page(page)
+    with open(output_path, 'wb') as output_pdf:
+        pdf_writer.write(output_pdf)
+    return len(pdf_writer.pages)
+
+def benchmark(source_paths: List[str], worker_counts: List[int], repeat: int = 3) -> List[dict]:
+    """Time the sequential merge against the process pool at each worker count."""
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_path = os.path.join(output_dir, 'merged.pdf')
+
+        def best_of(merge) -> float:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                merge()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        baseline = best_of(lambda: merge_pdfs_sequential(source_paths, output_path))
+        results.append({'engine': 'sequential', 'workers': 1, 'seconds': round(baseline, 3), 'speedup': 1.0})
+
+        for workers in worker_counts:
+            engine = ParallelMergeEngine(workers)
+            try:
+                # Start the workers outside the timed runs, as a server would
+                engine.merge(source_paths, output_path)
+                seconds = best_of(lambda: engine.merge(source_paths, output_path))
+            finally:
+                engine.close()
+            results.append({
+                'engine': 'process_pool',
+                'workers': workers,
+                'seconds': round(seconds, 3),
+                'speedup': round(baseline / seconds, 2),
+            })
+    return results
+
+# views.py
+import os
+import tempfile
+import threading
+from django.conf import settings
+from django.http import FileResponse, HttpResponseBadRequest
+from django.shortcuts import render
+from PyPDF2.errors import PdfReadError
+from .parallel_merge import ParallelMergeEngine
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine() -> ParallelMergeEngine:
+    """One engine, and so one worker pool, per server process."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = ParallelMergeEngine(settings.PDF_PARSE_WORKERS)
+        return _engine
+
+def merge_pdf_view(request):
+    """
+    Handle the PDF merging request, parsing the uploads in parallel.
+    """
+    if request.method == 'POST' and request.FILES.getlist('pdf_files'):
+        pdf_files = request.FILES.getlist('pdf_files')
+
+        # Worker processes open the inputs by path, so spool them to disk first.
+        # Each request gets its own directory, so concurrent merges never collide.
+        with tempfile.TemporaryDirectory(prefix='pdf-merge-') as work_dir:
+            source_paths = []
+            for position, pdf_file in enumerate(pdf_files):
+                path = os.path.join(work_dir, f'{position:05d}.pdf')
+                with open(path, 'wb') as destination:
+                    for chunk in pdf_file.chunks():
+                        destination.write(chunk)
+                source_paths.append(path)
+
+            merged_pdf_path = os.path.join(work_dir, 'merged_document.pdf')
+            try:
+                get_engine().merge(source_paths, merged_pdf_path)
+            except (PdfReadError, ValueError) as e:
+                return HttpResponseBadRequest(f'Could not read the uploaded PDFs: {e}')
+            # The open handle keeps the data readable after the directory is removed
+            merged_pdf = open(merged_pdf_path, 'rb')
+
+        return FileResponse(
+            merged_pdf,
+            as_attachment=True,
+            filename='merged_document.pdf',
+            content_type='application/pdf',
+        )
+
+    return render(request, 'merge_pdf.html')
+
+# management/commands/benchmark_parallel_merge.py
+import os
+from django.core.management.base import BaseCommand
+from ...parallel_merge import benchmark
+
+class Command(BaseCommand):
+    help = 'Compare sequential PDF merging with the process-pool merge engine'
+
+    def add_arguments(self, parser):
+        parser.add_argument('pdf_paths', nargs='+')
+        parser.add_argument('--workers', default=None,
+                            help='Comma-separated worker counts, defaults to 1,2,4,... up to the core count')
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        if options['workers']:
+            worker_counts = [int(count) for count in options['workers'].split(',')]
+        else:
+            cores = os.cpu_count() or 1
+            worker_counts = [1]
+            while worker_counts[-1] * 2 <= cores:
+                worker_counts.append(worker_counts[-1] * 2)
+
+        for row in benchmark(options['pdf_paths'], worker_counts, options['repeat']):
+            self.stdout.write(
+                f"{row['engine']:<14} workers={row['workers']:<3} "
+                f"{row['seconds']:>8.3f}s  speedup x{row['speedup']}"
+            )
+
+# urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('merge-pdfs/', views.merge_pdf_view, name='merge_pdf_view'),
+]
+
+# Example:
+# python manage.py benchmark_parallel_merge scans/*.pdf --workers 1,2,4,8
+# sequential     workers=1    <seconds>s  speedup x1.0
+# process_pool   workers=1    <seconds>s  speedup x<ratio>
+# process_pool   workers=2    <seconds>s  speedup x<ratio>
+# ...
+```
+
+This merge engine spreads the expensive part of merging, parsing each input with `PdfReader`, across a `ProcessPoolExecutor`. Each worker parses one input and serializes every object its pages reference as ready-to-write PDF bytes. References are kept as document-local numbers. The parent never parses an input again. It shifts each document's numbers past those already written, copies the bytes through and adds a page tree, catalog and cross-reference table. Its serial share is therefore a single write pass rather than a repeat of the sequential merge. The worker pool is created once per server process and reused. If a worker dies, the pool is replaced. Every request spools its uploads and writes its output in its own temporary directory, so concurrent merges don't overwrite each other. Nothing is placed in `/dev/shm`. The `benchmark_parallel_merge` command times the current sequential merge against the pool at increasing worker counts and prints the speedup. It starts the pool before timing, as a running server would. Gains depend on how much of the total time goes into parsing, so run it on a representative set of inputs on a multi-core host.
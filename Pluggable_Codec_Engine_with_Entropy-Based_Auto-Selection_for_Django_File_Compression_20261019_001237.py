@@ -0,0 +1,242 @@
+Title: Pluggable Codec Engine with Entropy-Based Auto-Selection for Django File Compression
+
+```python
+# Install Django; zstd support is optional:
+# pip install django
+# pip install zstandard  # optional
+
+# settings.py
+# Default codec for uploads: 'auto' or any name registered in codecs.py
+COMPRESSION_CODEC = 'auto'
+COMPRESSION_LEVEL = None  # None uses each codec's default level
+
+# models.py in myapp
+from django.db import models
+
+class UploadedFile(models.Model):
+    original_file = models.FileField(upload_to='uploads/')
+    compressed_file = models.FileField(upload_to='compressed/', blank=True, null=True)
+    uploaded_at = models.DateTimeField(auto_now_add=True)
+    # Per-upload compression statistics
+    codec = models.CharField(max_length=10, blank=True)
+    level = models.PositiveSmallIntegerField(blank=True, null=True)
+    original_size = models.PositiveBigIntegerField(default=0)
+    compressed_size = models.PositiveBigIntegerField(default=0)
+    compress_seconds = models.FloatField(default=0)
+
+    @property
+    def ratio(self) -> float:
+        """Compressed size as a fraction of the original (lower is better)."""
+        return self.compressed_size / self.original_size if self.original_size else 1.0
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Input megabytes compressed per second."""
+        return self.original_size / 1e6 / self.compress_seconds if self.compress_seconds else 0.0
+
+# codecs.py in myapp
+# A small registry of streaming codecs, each writing a standard file format
+
+import bz2
+import gzip
+import lzma
+import math
+import zipfile
+from collections import Counter
+from typing import Callable, Dict, NamedTuple, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstd is offered only when the package is installed
+    zstandard = None
+
+class Codec(NamedTuple):
+    name: str
+    extension: str
+    default_level: Optional[int]
+    levels: range
+    open_writer: Callable  # (path, level, arcname) -> writable file object
+
+class _ZipEntryWriter:
+    """Write one deflated entry to a ZIP archive through a file-like API."""
+
+    def __init__(self, path, level, arcname):
+        self.archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=level)
+        self.entry = self.archive.open(arcname, 'w', force_zip64=True)
+
+    def write(self, data):
+        return self.entry.write(data)
+
+    def close(self):
+        self.entry.close()
+        self.archive.close()
+
+def _open_zstd(path, level, arcname):
+    return zstandard.ZstdCompressor(level=level).stream_writer(open(path, 'wb'), closefd=True)
+
+CODECS: Dict[str, Codec] = {
+    'store': Codec('store', '', None, range(0), lambda path, level, arcname: open(path, 'wb')),
+    'deflate': Codec('deflate', '.zip', 6, range(1, 10), _ZipEntryWriter),
+    'gzip': Codec('gzip', '.gz', 6, range(1, 10),
+                  lambda path, level, arcname: gzip.open(path, 'wb', compresslevel=level)),
+    'bz2': Codec('bz2', '.bz2', 9, range(1, 10),
+                 lambda path, level, arcname: bz2.open(path, 'wb', compresslevel=level)),
+    'lzma': Codec('lzma', '.xz', 6, range(0, 10),
+                  lambda path, level, arcname: lzma.open(path, 'wb', preset=level)),
+}
+if zstandard is not None:
+    CODECS['zstd'] = Codec('zstd', '.zst', 3, range(1, 23), _open_zstd)
+
+# Formats that are already compressed and gain nothing from another pass
+PRECOMPRESSED_TYPES = (
+    'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/heic', 'video/', 'audio/',
+    'application/zip', 'application/gzip', 'application/x-7z-compressed',
+    'application/x-rar-compressed', 'application/x-xz', 'application/x-bzip2', 'application/zstd',
+)
+STORE_ENTROPY = 7.5  # bits per byte; random data is 8.0
+SAMPLE_SIZE = 64 * 1024
+
+def shannon_entropy(sample: bytes) -> float:
+    """Return the entropy of `sample` in bits per byte."""
+    if not sample:
+        return 0.0
+    total = len(sample)
+    return -sum(count / total * math.log2(count / total) for count in Counter(sample).values())
+
+def choose_codec(sample: bytes, content_type: str = '') -> str:
+    """
+    Pick a codec from the first chunk of a file and its content type.
+
+    Already-compressed media and high-entropy data are stored as-is. Highly
+    redundant data such as text and logs gets zstd, or gzip when zstd is not
+    installed, since both are fast at their default levels. Anything in
+    between gets deflate for compatibility.
+    """
+    if content_type and content_type.startswith(PRECOMPRESSED_TYPES):
+        return 'store'
+    entropy = shannon_entropy(sample[:SAMPLE_SIZE])
+    if entropy >= STORE_ENTROPY:
+        return 'store'
+    if entropy < 5.0:
+        return 'zstd' if 'zstd' in CODECS else 'gzip'
+    return 'deflate'
+
+# forms.py in myapp
+from django import forms
+from django.conf import settings
+from .codecs import CODECS
+from .models import UploadedFile
+
+class UploadFileForm(forms.ModelForm):
+    # Not model fields: the stored codec and level are the ones actually used
+    codec = forms.ChoiceField(choices=[(name, name) for name in ['auto'] + sorted(CODECS)], required=False)
+    level = forms.IntegerField(required=False, min_value=0)
+
+    class Meta:
+        model = UploadedFile
+        fields = ['original_file']
+
+    def clean(self):
+        cleaned_data = super().clean()
+        codec = cleaned_data.get('codec') or settings.COMPRESSION_CODEC
+        if codec != 'auto' and codec not in CODECS:
+            # The configured default names a codec that is not installed, e.g. zstd
+            codec = 'gzip'
+        level = cleaned_data.get('level')
+        cleaned_data['codec'] = codec
+        if level is None:
+            # A configured default the codec cannot use falls back to the
+            # codec's own default level in compress_file
+            cleaned_data['level'] = settings.COMPRESSION_LEVEL
+        elif codec != 'auto' and level not in CODECS[codec].levels:
+            # In auto mode the level is only a hint; out-of-range values fall back to the default
+            self.add_error('level', f'{codec} does not accept level {level}')
+        return cleaned_data
+
+# views.py in myapp
+import itertools
+import os
+import time
+from django.conf import settings
+from django.shortcuts import render, redirect
+from .codecs import CODECS, choose_codec
+from .forms import UploadFileForm
+
+def upload_file(request):
+    if request.method == 'POST':
+        form = UploadFileForm(request.POST, request.FILES)
+        if not form.is_valid():
+            # Codec and level are checked before anything is saved
+            return render(request, 'upload.html', {'form': form, 'codecs': sorted(CODECS) + ['auto']},
+                          status=400)
+        uploaded_file = form.save()
+        content_type = request.FILES['original_file'].content_type
+        compress_file(uploaded_file, form.cleaned_data['codec'], form.cleaned_data['level'], content_type)
+        return redirect('download_file', file_name=os.path.basename(uploaded_file.compressed_file.name))
+    form = UploadFileForm()
+    return render(request, 'upload.html', {'form': form, 'codecs': sorted(CODECS) + ['auto']})
+
+def compress_file(uploaded_file, codec='auto', level=None, content_type=''):
+    """
+    Compress the stored original with the requested codec and record stats.
+
+    The original is read once in chunks. In auto mode the first chunk is
+    sampled before the codec is chosen, then written like any other chunk.
+    """
+    source = uploaded_file.original_file
+    source.open('rb')
+    try:
+        chunks = source.chunks()
+        first = next(chunks, b'')
+        if codec == 'auto':
+            codec = choose_codec(first, content_type)
+        if codec not in CODECS:
+            raise ValueError(f'Unknown codec: {codec}')
+        spec = CODECS[codec]
+        if spec.default_level is None:
+            level = None
+        elif level is None or level not in spec.levels:
+            level = spec.default_level
+
+        arcname = os.path.basename(source.name)
+        # A stored copy keeps its own name, otherwise the codec extension is added
+        compressed_name = f'compressed/{arcname}{spec.extension}'
+        compressed_path = os.path.join(settings.MEDIA_ROOT, compressed_name)
+        os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
+
+        started = time.perf_counter()
+        original_size = 0
+        writer = spec.open_writer(compressed_path, level, arcname)
+        try:
+            for chunk in itertools.chain([first], chunks):
+                writer.write(chunk)
+                original_size += len(chunk)
+        finally:
+            writer.close()
+        elapsed = time.perf_counter() - started
+    finally:
+        source.close()
+
+    uploaded_file.compressed_file.name = compressed_name
+    uploaded_file.codec = codec
+    uploaded_file.level = level
+    uploaded_file.original_size = original_size
+    uploaded_file.compressed_size = os.path.getsize(compressed_path)
+    uploaded_file.compress_seconds = elapsed
+    uploaded_file.save()
+    return uploaded_file
+
+# admin.py in myapp
+# Per-upload statistics at a glance
+
+from django.contrib import admin
+from .models import UploadedFile
+
+@admin.register(UploadedFile)
+class UploadedFileAdmin(admin.ModelAdmin):
+    list_display = ('original_file', 'codec', 'level', 'original_size', 'compressed_size',
+                    'ratio', 'throughput_mb_s', 'uploaded_at')
+    list_filter = ('codec',)
+```
+
+This version of the compression tool replaces the fixed ZIP output with a small codec registry. It offers `deflate` (ZIP), `gzip`, `bz2`, `lzma` (xz) and, when the `zstandard` package is installed, `zstd`, each at a selectable level. A `store` codec copies the file unchanged. In `auto` mode, `compress_file` reads the first chunk and checks the upload's content type. JPEGs, videos, archives and any data with more than 7.5 bits of entropy per byte are stored as-is. Highly redundant data such as text and logs gets zstd (or gzip without it), and everything else gets deflate. `UploadFileForm` checks the requested codec and level before the upload is saved. An unknown codec or an out-of-range level re-renders the form with a 400 and leaves no row behind. Each upload records its codec, level, sizes and compression time, and the admin shows the resulting ratio and throughput.
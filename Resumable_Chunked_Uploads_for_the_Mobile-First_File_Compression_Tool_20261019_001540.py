@@ -0,0 +1,220 @@
+Title: Resumable Chunked Uploads for the Mobile-First File Compression Tool
+
+```python
+# settings.py
+# Resumable upload settings
+
+RESUMABLE_MAX_CHUNK_SIZE = 8 * 1024 * 1024
+RESUMABLE_MAX_FILE_SIZE = 4 * 1024 ** 3
+RESUMABLE_COMPRESSION_LEVEL = 6
+
+# urls.py in myapp
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.upload_file, name='upload_file'),
+    path('uploads/', views.create_upload, name='create_upload'),
+    path('uploads/<uuid:upload_id>/', views.upload_chunk, name='upload_chunk'),
+    path('download/<str:file_name>/', views.download_file, name='download_file'),
+]
+
+# models.py in myapp
+import uuid
+from django.db import models
+
+class UploadedFile(models.Model):
+    original_file = models.FileField(upload_to='uploads/')
+    compressed_file = models.FileField(upload_to='compressed/', blank=True, null=True)
+    uploaded_at = models.DateTimeField(auto_now_add=True)
+
+class UploadSession(models.Model):
+    """
+    State of one resumable upload.
+
+    `offset` is the number of bytes received and verified so far, and
+    `compressed_size` the length of the compressed output written for them.
+    Both are only advanced after a chunk has been fully written, so they
+    always describe a consistent prefix of the partial files.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    file_name = models.CharField(max_length=255)
+    total_size = models.PositiveBigIntegerField()
+    offset = models.PositiveBigIntegerField(default=0)
+    compressed_size = models.PositiveBigIntegerField(default=0)
+    uploaded_file = models.OneToOneField(UploadedFile, on_delete=models.SET_NULL, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def complete(self) -> bool:
+        return self.offset == self.total_size
+
+    @property
+    def part_name(self) -> str:
+        return f'uploads/partial/{self.id}.part'
+
+    @property
+    def compressed_name(self) -> str:
+        return f'compressed/{self.id}_{self.file_name}.gz'
+
+# resumable.py in myapp
+# Chunk assembly with incremental compression
+
+import gzip
+import hashlib
+import os
+from django.conf import settings
+
+class ChunkError(Exception):
+    """A chunk that cannot be accepted; `status` is the HTTP status to return."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+def _truncate(path: str, size: int) -> None:
+    """Drop bytes written after the last committed offset, e.g. by a crashed request."""
+    with open(path, 'ab') as f:
+        f.truncate(size)
+
+def append_chunk(session, offset: int, data: bytes, checksum: str) -> None:
+    """
+    Verify a chunk and append it to both the assembled file and the archive.
+
+    The chunk must start exactly at the committed offset. Each accepted chunk
+    is compressed right away as its own gzip member and appended to the
+    output. Concatenated members form one standard .gz file, so compression
+    keeps pace with the upload and no state has to survive between requests.
+    """
+    if offset != session.offset:
+        raise ChunkError(f'Expected offset {session.offset}', status=409)
+    if offset + len(data) > session.total_size:
+        raise ChunkError('Chunk runs past the declared file size', status=413)
+    if hashlib.sha256(data).hexdigest() != checksum.lower():
+        raise ChunkError('Chunk checksum mismatch', status=400)
+
+    part_path = os.path.join(settings.MEDIA_ROOT, session.part_name)
+    compressed_path = os.path.join(settings.MEDIA_ROOT, session.compressed_name)
+    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+    os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
+    _truncate(part_path, session.offset)
+    _truncate(compressed_path, session.compressed_size)
+
+    with open(part_path, 'ab') as part:
+        part.write(data)
+    member = gzip.compress(data, compresslevel=settings.RESUMABLE_COMPRESSION_LEVEL, mtime=0)
+    with open(compressed_path, 'ab') as compressed:
+        compressed.write(member)
+
+    session.offset += len(data)
+    session.compressed_size += len(member)
+
+# views.py in myapp
+import json
+import os
+from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from .models import UploadSession, UploadedFile
+from .resumable import ChunkError, append_chunk
+
+def _session_state(session):
+    response = JsonResponse({
+        'upload_id': str(session.id),
+        'offset': session.offset,
+        'total_size': session.total_size,
+        'complete': session.complete,
+        'download': os.path.basename(session.compressed_name) if session.complete else None,
+    })
+    response['Upload-Offset'] = str(session.offset)
+    return response
+
+@csrf_exempt
+def create_upload(request):
+    """Start a resumable upload: POST {"file_name": ..., "size": ...}."""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        payload = json.loads(request.body)
+        file_name = os.path.basename(payload['file_name'])
+        size = int(payload['size'])
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'error': 'file_name and size are required'}, status=400)
+    if not file_name or size <= 0 or size > settings.RESUMABLE_MAX_FILE_SIZE:
+        return JsonResponse({'error': 'Invalid file name or size'}, status=400)
+
+    session = UploadSession.objects.create(file_name=file_name, total_size=size)
+    response = _session_state(session)
+    response.status_code = 201
+    response['Location'] = f'/uploads/{session.id}/'
+    return response
+
+@csrf_exempt
+def upload_chunk(request, upload_id):
+    """
+    GET or HEAD returns the committed offset to resume from.
+
+    PUT appends a chunk: send `Upload-Offset` with the byte position of the
+    chunk and `Upload-Checksum` with its SHA-256 hex digest. A 409 response
+    carries the offset the server expects.
+    """
+    if request.method in ('GET', 'HEAD'):
+        try:
+            return _session_state(UploadSession.objects.get(pk=upload_id))
+        except UploadSession.DoesNotExist:
+            return JsonResponse({'error': 'Unknown upload'}, status=404)
+    if request.method != 'PUT':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        offset = int(request.headers['Upload-Offset'])
+        checksum = request.headers['Upload-Checksum']
+        length = int(request.headers.get('Content-Length') or 0)
+    except (KeyError, ValueError):
+        return JsonResponse({'error': 'Upload-Offset and Upload-Checksum headers are required'}, status=400)
+    if length > settings.RESUMABLE_MAX_CHUNK_SIZE:
+        return JsonResponse({'error': 'Chunk too large'}, status=413)
+    # Read the raw stream so DATA_UPLOAD_MAX_MEMORY_SIZE does not apply to chunks
+    data = request.read(length)
+
+    with transaction.atomic():
+        # Serialize chunks for the same upload so offsets cannot race
+        try:
+            session = UploadSession.objects.select_for_update().get(pk=upload_id)
+        except UploadSession.DoesNotExist:
+            return JsonResponse({'error': 'Unknown upload'}, status=404)
+        if session.complete:
+            return _session_state(session)
+        try:
+            append_chunk(session, offset, data, checksum)
+        except ChunkError as e:
+            response = JsonResponse({'error': str(e), 'offset': session.offset}, status=e.status)
+            response['Upload-Offset'] = str(session.offset)
+            return response
+
+        if session.complete:
+            finish_upload(session)
+        session.save()
+    return _session_state(session)
+
+def finish_upload(session):
+    """Move the assembled file into uploads/ and record the finished upload."""
+    final_name = f'uploads/{session.id}_{session.file_name}'
+    os.replace(
+        os.path.join(settings.MEDIA_ROOT, session.part_name),
+        os.path.join(settings.MEDIA_ROOT, final_name),
+    )
+    uploaded_file = UploadedFile(original_file=final_name, compressed_file=session.compressed_name)
+    uploaded_file.save()
+    session.uploaded_file = uploaded_file
+
+# Client protocol (e.g. from a mobile app):
+# 1. POST /uploads/ {"file_name": "video.mov", "size": 73400320}  -> 201 {"upload_id": ...}
+# 2. For each chunk: PUT /uploads/<id>/ with Upload-Offset and Upload-Checksum headers
+# 3. After a dropped connection: HEAD /uploads/<id>/ and continue from Upload-Offset
+# 4. When "complete" is true, fetch /download/<download>/
+```
+
+This adds a resumable upload protocol to the mobile-first compression tool, so a dropped connection no longer loses the whole upload. A client first creates an upload session, then sends chunks with `PUT`. Each chunk carries its byte offset and SHA-256 checksum. The server accepts a chunk only when it starts at the committed offset and its checksum matches. After a dropped connection the client asks for the current offset with `HEAD` and resumes from there. Accepted chunks are appended to the assembled file and compressed straight away as separate gzip members appended to the `.gz` output. Concatenated members are valid gzip, so compression keeps up with the upload and the file is never read again after the last chunk. Bytes left behind by an interrupted request are truncated away before the next chunk is written.
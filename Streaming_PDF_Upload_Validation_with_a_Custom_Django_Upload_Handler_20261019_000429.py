@@ -0,0 +1,191 @@
+Title: Streaming PDF Upload Validation with a Custom Django Upload Handler
+
+```python
+# Install necessary package
+# pip install PyPDF2
+
+# settings.py
+# Size limits enforced while the upload is still streaming in
+
+PDF_UPLOAD_MAX_FILE_SIZE = 50 * 1024 * 1024     # 50 MB per PDF
+PDF_UPLOAD_MAX_TOTAL_SIZE = 200 * 1024 * 1024   # 200 MB per request
+
+# upload_handlers.py
+import hashlib
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+
+PDF_MAGIC = b'%PDF-'
+
+class PDFValidatingUploadHandler(FileUploadHandler):
+    """
+    Validate PDF uploads chunk by chunk while Django parses the request body.
+
+    The handler must run before Django's memory and temporary-file handlers.
+    It checks the `%PDF-` magic bytes, hashes the content and counts bytes
+    as they arrive, then passes each chunk on unchanged. A bad upload stops
+    the parse at once, before it is fully buffered. The error is stored on
+    `request.upload_error` and the SHA-256 of each accepted file, in upload
+    order, on `request.upload_hashes`.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_file_size = settings.PDF_UPLOAD_MAX_FILE_SIZE
+        self.max_total_size = settings.PDF_UPLOAD_MAX_TOTAL_SIZE
+        self.total_received = 0
+        self.body_too_large = False
+        request.upload_error = None
+        request.upload_hashes = []
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # Remember an oversized body announced by the client; StopUpload is
+        # only handled by the parser once it starts reading the parts
+        self.body_too_large = content_length > self.max_total_size
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        if self.body_too_large:
+            self._reject('Upload exceeds the total size limit.', connection_reset=True)
+        if not file_name.lower().endswith('.pdf'):
+            self._reject(f'{file_name} is not a PDF file.')
+        self.hasher = hashlib.sha256()
+        self.file_received = 0
+        self.head = b''
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file_received += len(raw_data)
+        self.total_received += len(raw_data)
+        if self.file_received > self.max_file_size:
+            self._reject(f'{self.file_name} exceeds the per-file size limit.', connection_reset=True)
+        if self.total_received > self.max_total_size:
+            self._reject('Upload exceeds the total size limit.', connection_reset=True)
+
+        # The first chunk may be shorter than the magic, so buffer until it is complete
+        if len(self.head) < len(PDF_MAGIC):
+            self.head += raw_data[:len(PDF_MAGIC) - len(self.head)]
+            if not PDF_MAGIC.startswith(self.head[:len(PDF_MAGIC)]):
+                self._reject(f'{self.file_name} is not a PDF file.')
+
+        self.hasher.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.head != PDF_MAGIC:
+            self._reject(f'{self.file_name} is not a PDF file.')
+        self.request.upload_hashes.append(self.hasher.hexdigest())
+        # Let the next handler build the UploadedFile object
+        return None
+
+    def _reject(self, message, connection_reset=False):
+        self.request.upload_error = message
+        # Oversized bodies are cut off; a bad file drains the rest of the
+        # body without storing it so the client still receives the error
+        raise StopUpload(connection_reset=connection_reset)
+
+def install_pdf_upload_handler(request):
+    """Put the validating handler in front of Django's default handlers."""
+    request.upload_handlers.insert(0, PDFValidatingUploadHandler(request))
+
+# forms.py
+from django import forms
+from django.core.exceptions import ValidationError
+
+class PDFMergeForm(forms.Form):
+    pdf_files = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'multiple': True}),
+        label='Select PDF files to merge',
+    )
+
+    def __init__(self, *args, upload_error=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upload_error = upload_error
+
+    # Type and size were already checked while streaming; only the count is left
+    def clean_pdf_files(self):
+        if self.upload_error:
+            raise ValidationError(self.upload_error)
+        files = self.files.getlist('pdf_files')
+        if len(files) < 2:
+            raise ValidationError('Please upload at least two PDF files.')
+        return files
+
+# views.py
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from PyPDF2 import PdfMerger, PdfReader, PdfWriter
+from .forms import PDFMergeForm
+from .upload_handlers import install_pdf_upload_handler
+
+# The upload handlers have to be replaced before CsrfViewMiddleware reads
+# request.POST, so the outer view is exempt and the inner one is protected
+
+@csrf_exempt
+def merge_pdfs(request):
+    if request.method == 'POST':
+        install_pdf_upload_handler(request)
+    return _merge_pdfs(request)
+
+@csrf_protect
+def _merge_pdfs(request):
+    if request.method == 'POST':
+        form = PDFMergeForm(request.POST, request.FILES, upload_error=request.upload_error)
+        if form.is_valid():
+            pdf_writer = PdfWriter()
+            for pdf in form.cleaned_data['pdf_files']:
+                pdf_reader = PdfReader(pdf)
+                for page in pdf_reader.pages:
+                    pdf_writer.add_page(page)
+
+            response = HttpResponse(content_type='application/pdf')
+            response['Content-Disposition'] = 'attachment; filename="merged_document.pdf"'
+            pdf_writer.write(response)
+            return response
+    else:
+        form = PDFMergeForm()
+
+    return render(request, 'merge_pdfs.html', {'form': form})
+
+@csrf_exempt
+def upload_and_merge_pdf(request):
+    """View to handle PDF upload and merge."""
+    if request.method == 'POST':
+        install_pdf_upload_handler(request)
+        files = request.FILES.getlist('pdf_files')
+
+        if request.upload_error:
+            return JsonResponse({"error": request.upload_error}, status=400)
+        if not files:
+            return JsonResponse({"error": "No PDF files uploaded"}, status=400)
+
+        merger = PdfMerger()
+        try:
+            for pdf in files:
+                merger.append(pdf)
+
+            response = HttpResponse(content_type='application/pdf')
+            response['Content-Disposition'] = 'attachment; filename="merged.pdf"'
+            response['X-Content-SHA256'] = ','.join(request.upload_hashes)
+            merger.write(response)
+            return response
+
+        except Exception as e:
+            return JsonResponse({"error": f"An error occurred while merging PDFs: {str(e)}"}, status=500)
+
+        finally:
+            merger.close()
+
+    return render(request, 'upload.html')
+
+# urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('merge/', views.merge_pdfs, name='merge_pdfs'),
+    path('upload-merge/', views.upload_and_merge_pdf, name='upload_and_merge_pdf'),
+]
+```
+
+This version of the PDF merge views validates uploads while Django is still parsing the multipart body, instead of checking `content_type` and the file name after everything has been buffered. `PDFValidatingUploadHandler` sits in front of the default memory and temporary-file handlers. It checks the `%PDF-` signature in the first bytes of each file, computes a SHA-256 hash of the content and enforces both a per-file and a per-request size limit. A failing upload raises `StopUpload`, so the rest of the body is never written to memory or a temp file, and the view reports the stored error. The content hashes are kept on the request for later steps such as caching or deduplication.
@@ -0,0 +1,249 @@
+Title: Streaming ZIP Compression from the Upload Stream in Django
+
+```python
+# settings.py
+# Standard Django settings; no extra packages are needed
+
+INSTALLED_APPS = [
+    # ...
+    'myapp',  # The app where the file compression logic is placed
+]
+
+# urls.py in myapp
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.upload_file, name='upload_file'),
+    path('compress/', views.upload_and_compress, name='upload_and_compress'),
+    path('compress/success/', views.upload_success, name='upload_success'),
+    path('download/<str:file_name>/', views.download_file, name='download_file'),
+]
+
+# models.py in myapp
+# The original is now optional: it is only stored when the client asks for it
+
+from django.db import models
+
+class UploadedFile(models.Model):
+    original_file = models.FileField(upload_to='uploads/', blank=True, null=True)
+    original_name = models.CharField(max_length=255, blank=True)
+    original_size = models.PositiveBigIntegerField(default=0)
+    compressed_file = models.FileField(upload_to='compressed/', blank=True, null=True)
+    compressed_size = models.PositiveBigIntegerField(default=0)
+    uploaded_at = models.DateTimeField(auto_now_add=True)
+
+class FileUpload(models.Model):
+    uploaded_file = models.FileField(upload_to='uploads/', blank=True, null=True)
+    compressed_file = models.FileField(upload_to='compressed/', blank=True, null=True)
+
+# upload_handlers.py in myapp
+# Compress each uploaded file chunk by chunk while Django parses the request
+
+import os
+import uuid
+import zipfile
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from django.utils.text import get_valid_filename
+
+class CompressedUpload(File):
+    """The ZIP written for one uploaded file, as returned in request.FILES."""
+
+    def __init__(self, path, name, original_name, original_size):
+        super().__init__(None, name)
+        self.path = path
+        self.original_name = original_name
+        self.original_size = original_size
+        self.size = os.path.getsize(path)
+
+    def open(self, mode='rb'):
+        # There is no underlying file until someone asks to read the archive
+        self.file = open(self.path, mode)
+        return self
+
+    def close(self):
+        # Django closes every file in request.FILES when the response is done
+        if self.file is not None:
+            self.file.close()
+
+class ZipStreamingUploadHandler(FileUploadHandler):
+    """
+    Deflate the files of one form field into MEDIA_ROOT/compressed as they arrive.
+
+    Files in other fields are left to Django's default handlers. Nothing
+    but the compressed artifact touches the disk unless `keep_original` is
+    set. In that case every chunk is also passed on to the default
+    handlers, which store the original as usual. Details of each archive
+    written are appended to `request.compressed_uploads`.
+    """
+
+    def __init__(self, request, field_name, keep_original=False):
+        super().__init__(request)
+        self.target_field = field_name
+        self.keep_original = keep_original
+        self.active = False
+        request.compressed_uploads = []
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self.active = field_name == self.target_field
+        if not self.active:
+            return
+        arcname = get_valid_filename(os.path.basename(file_name)) or 'file'
+        self.arcname = arcname
+        self.zip_name = f'compressed/{uuid.uuid4().hex}_{arcname}.zip'
+        self.zip_path = os.path.join(settings.MEDIA_ROOT, self.zip_name)
+        os.makedirs(os.path.dirname(self.zip_path), exist_ok=True)
+
+        self.archive = zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED)
+        # force_zip64 because the final size is unknown while streaming
+        self.entry = self.archive.open(arcname, 'w', force_zip64=True)
+        self.received = 0
+
+        if not self.keep_original:
+            # No other handler needs to see this file
+            raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.active:
+            return raw_data
+        self.entry.write(raw_data)
+        self.received += len(raw_data)
+        return raw_data if self.keep_original else None
+
+    def file_complete(self, file_size):
+        if not self.active:
+            return None
+        self.active = False
+        self.entry.close()
+        self.archive.close()
+        self.archive = None
+        upload = CompressedUpload(self.zip_path, self.zip_name, self.arcname, self.received)
+        self.request.compressed_uploads.append(upload)
+        # With keep_original the next handler returns the original file instead
+        return None if self.keep_original else upload
+
+    def upload_interrupted(self):
+        # Remove the partial archive of an aborted upload
+        archive = getattr(self, 'archive', None)
+        if archive is not None:
+            try:
+                self.entry.close()
+                archive.close()
+            except (OSError, ValueError):
+                pass
+            if os.path.exists(self.zip_path):
+                os.remove(self.zip_path)
+
+# views.py in myapp
+# Handle file upload, compression, and download
+
+from django.shortcuts import render, redirect
+from django.http import HttpResponse
+from django.conf import settings
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from .models import FileUpload, UploadedFile
+from .upload_handlers import CompressedUpload, ZipStreamingUploadHandler
+import os
+
+# The upload handler has to be installed before CsrfViewMiddleware reads
+# request.POST, so the outer views are exempt and the inner ones are protected
+
+def _install_zip_handler(request, field_name):
+    if request.method == 'POST':
+        # ?keep_original=1 also stores the uncompressed upload
+        keep_original = request.GET.get('keep_original') == '1'
+        request.upload_handlers.insert(0, ZipStreamingUploadHandler(request, field_name, keep_original))
+
+def _originals(request, field_name):
+    """Originals stored with ?keep_original=1, in the same order as the archives."""
+    return [f for f in request.FILES.getlist(field_name) if not isinstance(f, CompressedUpload)]
+
+@csrf_exempt
+def upload_file(request):
+    _install_zip_handler(request, 'original_file')
+    return _upload_file(request)
+
+@csrf_protect
+def _upload_file(request):
+    # Reading request.FILES parses the body, which runs the handler
+    originals = _originals(request, 'original_file') if request.method == 'POST' else []
+    if request.method == 'POST' and request.compressed_uploads:
+        # One row per archive, so no file in compressed/ is left unreferenced
+        for position, compressed in enumerate(request.compressed_uploads):
+            uploaded_file = UploadedFile(
+                original_name=compressed.original_name,
+                original_size=compressed.original_size,
+                compressed_size=compressed.size,
+            )
+            # The archive is already in MEDIA_ROOT, so only its name is recorded
+            uploaded_file.compressed_file.name = compressed.name
+            if position < len(originals):
+                uploaded_file.original_file = originals[position]
+            uploaded_file.save()
+
+        first = request.compressed_uploads[0]
+        return redirect('download_file', file_name=os.path.basename(first.name))
+    return render(request, 'upload.html')
+
+@csrf_exempt
+def upload_and_compress(request):
+    _install_zip_handler(request, 'uploaded_file')
+    return _upload_and_compress(request)
+
+@csrf_protect
+def _upload_and_compress(request):
+    # Reading request.FILES parses the body, which runs the handler
+    originals = _originals(request, 'uploaded_file') if request.method == 'POST' else []
+    if request.method == 'POST' and request.compressed_uploads:
+        for position, compressed in enumerate(request.compressed_uploads):
+            file_upload = FileUpload()
+            file_upload.compressed_file.name = compressed.name
+            if position < len(originals):
+                file_upload.uploaded_file = originals[position]
+            file_upload.save()
+        return redirect('upload_success')
+    return render(request, 'upload.html')
+
+def upload_success(request):
+    return render(request, 'success.html')
+
+def download_file(request, file_name):
+    # Serve the compressed file for download
+    file_abs_path = os.path.join(settings.MEDIA_ROOT, 'compressed', os.path.basename(file_name))
+
+    if os.path.exists(file_abs_path):
+        with open(file_abs_path, 'rb') as f:
+            response = HttpResponse(f.read(), content_type='application/zip')
+            response['Content-Disposition'] = f'attachment; filename={file_name}'
+            return response
+    return HttpResponse('File not found.')
+
+# templates/upload.html
+# The form posts straight to the view; add ?keep_original=1 to the action to keep the original
+
+'''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>File Compression Upload</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body>
+    <div class="container">
+        <h1>Upload Your File for Compression</h1>
+        <form method="post" enctype="multipart/form-data">
+            {% csrf_token %}
+            <input type="file" name="original_file" required>
+            <button type="submit">Upload</button>
+        </form>
+    </div>
+</body>
+</html>
+'''
+```
+
+This version of the file compression tool compresses uploads while they are still arriving. `ZipStreamingUploadHandler` runs ahead of Django's default upload handlers. For each file it opens an entry in a new ZIP archive under `MEDIA_ROOT/compressed` and deflates every chunk as the multipart parser hands it over. The original is never written to disk and never read back, so each byte is received once and written once, in compressed form. Both variants of the tool use the handler: `upload_file` with `UploadedFile` and `upload_and_compress` with `FileUpload`. Each view compresses only its own file field. Every archive written gets its own row, so nothing in `compressed/` is left unreferenced. When the request carries `?keep_original=1`, the chunks are also passed on to the default handlers and the original is stored in `uploads/` as before. An aborted upload removes its partial archive.